@@ -6,6 +6,8 @@ __version__ = "1.1.0"
 __author__ = "TheKoma-X"
 __license__ = "MIT"
 
+import functools
+
 from .bridge import AgentBridge
 from .protocol import AgentProtocol
 from .adapter import AdapterRegistry
@@ -86,22 +88,26 @@ __all__ = [
     "BaseExtendedAdapter"
 ]
 
-# Provide lazy loading functions
+# Provide lazy loading functions; each import runs once and the result is cached
+@functools.lru_cache(maxsize=None)
 def get_workflow_components():
     """Get workflow components without causing circular imports."""
     from .workflow import WorkflowEngine, WorkflowBuilder, WorkflowDefinition, TaskDefinition, WorkflowStatus, TaskStatus
     return WorkflowEngine, WorkflowBuilder, WorkflowDefinition, TaskDefinition, WorkflowStatus, TaskStatus
 
+@functools.lru_cache(maxsize=None)
 def get_model_components():
     """Get model components without causing circular imports."""
     from .models import ModelManager, ModelRouter, ModelSpec, ModelCapability, ModelProvider
     return ModelManager, ModelRouter, ModelSpec, ModelCapability, ModelProvider
 
+@functools.lru_cache(maxsize=None)
 def get_intelligence_components():
     """Get intelligence components without causing circular imports."""
     from .intelligence import IntelligenceManager, OptimizationStrategy
     return IntelligenceManager, OptimizationStrategy
 
+@functools.lru_cache(maxsize=None)
 def get_extended_adapter_components():
     """Get extended adapter components without causing circular imports."""
     from .adapters_extended import ExtendedAdapterManager, BaseExtendedAdapter
@@ -9,6 +9,9 @@ import importlib
 import os
 import sys
 from pathlib import Path
+
+from .utils import dumps_json
+
 # Defer importing of external dependencies to runtime
 
 
@@ -25,7 +28,7 @@ class BaseAdapter(ABC):
         # Import here to defer dependency loading
         try:
             import aiohttp
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps_json)
         except ImportError:
             raise ImportError("aiohttp is required for network operations. Please install it with 'pip install aiohttp'")
         
@@ -11,7 +11,7 @@ import aiohttp
 import requests
 
 from .protocol import Message, Protocol
-from .utils import sanitize_input
+from .utils import dumps_json, sanitize_input
 
 
 class BaseExtendedAdapter(ABC):
@@ -59,7 +59,7 @@ class LangChainAdapter(BaseExtendedAdapter):
                 )
             
             # Create HTTP session
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps_json)
             
             # Test connection
             async with self.session.get(f"{self.api_base}/health") as resp:
@@ -135,7 +135,7 @@ class LlamaIndexAdapter(BaseExtendedAdapter):
                 )
             
             # Create HTTP session
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps_json)
             
             # Test connection
             async with self.session.get(f"{self.api_base}/health") as resp:
@@ -213,7 +213,7 @@ class HaystackAdapter(BaseExtendedAdapter):
                 )
             
             # Create HTTP session
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps_json)
             
             # Test connection
             async with self.session.get(f"{self.api_base}/health") as resp:
@@ -380,7 +380,7 @@ class APIAdapter(BaseExtendedAdapter):
     async def connect(self) -> bool:
         """Validate API connectivity"""
         try:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+            self.session = aiohttp.ClientSession(headers=self.headers, json_serialize=dumps_json)
             
             # Test connection with a simple health check
             try:
@@ -16,8 +16,8 @@ from .intelligence import IntelligenceManager, OptimizationStrategy
 from .memory import MemoryManager
 from .events import EventBus, Event, EventType
 from .evaluation import TraceRecorder
+from .utils import dumps_json_bytes, generate_correlation_id
 # Import ExtendedAdapterManager lazily to avoid requiring aiohttp at module level
-import uuid
 from datetime import datetime
 
 
@@ -88,7 +88,7 @@ class AgentBridge:
                           message: Message, optimize: bool = False) -> Any:
         """Send a message from one framework to another."""
         import time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         logger = get_logger()
         metrics = get_metrics_collector()
@@ -118,7 +118,7 @@ class AgentBridge:
                     )
                     original_target = target_framework
                     target_framework = optimal_target
-                    logger.info("Bridge", f"Optimized routing: {original_target} -> {target_framework}")
+                    logger.info("Bridge", "Optimized routing: %s -> %s", original_target, target_framework)
             
             if target_framework not in self.adapters:
                 error_msg = f"Target framework {target_framework} not connected"
@@ -148,10 +148,14 @@ class AgentBridge:
             )
             
             # Send the message
+            send_start_ns = time.perf_counter_ns()
             result = await self.adapters[target_framework].send_message(translated_msg)
+            end_ns = time.perf_counter_ns()
+            metrics.record_timer_ns('send_latency', end_ns - send_start_ns)
             
             # Record metrics for intelligence
-            elapsed_time = time.time() - start_time
+            elapsed_ns = end_ns - start_ns
+            elapsed_time = elapsed_ns / 1e9
             
             # Publish event
             await self.event_bus.emit(EventType.MESSAGE_SENT, {
@@ -181,10 +185,10 @@ class AgentBridge:
             
             # Record metrics
             metrics.increment_counter('messages_sent')
-            metrics.record_timer('avg_response_time', elapsed_time)
+            metrics.record_timer_ns('avg_response_time', elapsed_ns)
             metrics.update_framework_stats(target_framework, 'send_message', success=True)
             
-            logger.info("Bridge", f"Message sent from {source_framework} to {target_framework}", {
+            logger.info("Bridge", "Message sent from %s to %s", source_framework, target_framework, {
                 "message_type": message.type.value if hasattr(message, 'type') and message.type else 'unknown',
                 "elapsed_time": elapsed_time,
                 "optimized": optimize
@@ -192,10 +196,11 @@ class AgentBridge:
             
             return result
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            elapsed_time = elapsed_ns / 1e9
             logger.exception("Bridge", f"Failed to send message from {source_framework} to {target_framework}", exc_info=e)
             metrics.increment_counter('errors')
-            metrics.record_timer('avg_response_time', elapsed_time)
+            metrics.record_timer_ns('avg_response_time', elapsed_ns)
             
             # Publish event for error
             await self.event_bus.emit(EventType.ERROR_OCCURRED, {
@@ -301,10 +306,10 @@ class AgentBridge:
         })
         
         # Update metrics
-        metrics.increment_counter('batch_operations', 1)
-        metrics.increment_counter('messages_sent', success_count)
+        counter_deltas = {'batch_operations': 1, 'messages_sent': success_count}
         if failure_count > 0:
-            metrics.increment_counter('errors', failure_count)
+            counter_deltas['errors'] = failure_count
+        metrics.increment_counter_many(counter_deltas)
         metrics.record_timer('avg_batch_duration', elapsed_time)
         
         return results
@@ -318,7 +323,7 @@ class AgentBridge:
         if target_frameworks is None:
             target_frameworks = list(self.adapters.keys())
         
-        logger.info("Bridge", f"Broadcasting message from {source_framework} to {len(target_frameworks)} frameworks", {
+        logger.info("Bridge", "Broadcasting message from %s to %d frameworks", source_framework, len(target_frameworks), {
             "target_frameworks": target_frameworks,
             "message_type": message.type.value if hasattr(message, 'type') and message.type else 'unknown'
         })
@@ -327,32 +332,61 @@ class AgentBridge:
         success_count = 0
         failure_count = 0
         
-        for framework in target_frameworks:
-            if framework != source_framework:
-                try:
-                    result = await self.send_message(
-                        source_framework, framework, message
-                    )
-                    results[framework] = result
-                    success_count += 1
-                except Exception as e:
-                    error_result = {"error": str(e)}
-                    results[framework] = error_result
-                    failure_count += 1
-                    logger.warning("Bridge", f"Broadcast to {framework} failed", error_result)
+        # Send to all targets concurrently, once per distinct target
+        targets = [
+            framework for framework in dict.fromkeys(target_frameworks)
+            if framework != source_framework
+        ]
+        # Each target is bounded by its own timeout so one slow framework
+        # cannot hold the whole broadcast open
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(self.send_message(source_framework, framework, message),
+                               timeout=self._framework_timeout(framework))
+              for framework in targets),
+            return_exceptions=True
+        )
+        timeout_count = 0
+        
+        for framework, outcome in zip(targets, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                results[framework] = {"error": "timeout", "target": framework}
+                failure_count += 1
+                timeout_count += 1
+                logger.warning("Bridge", "Broadcast to %s timed out", framework)
+            elif isinstance(outcome, Exception):
+                error_result = {"error": str(outcome)}
+                results[framework] = error_result
+                failure_count += 1
+                logger.warning("Bridge", "Broadcast to %s failed", framework, error_result)
+            elif isinstance(outcome, BaseException):
+                # Cancellation and the like are not per-target failures
+                raise outcome
+            else:
+                results[framework] = outcome
+                success_count += 1
                     
-        logger.info("Bridge", f"Broadcast completed: {success_count} successes, {failure_count} failures", {
-            "total_targets": len([f for f in target_frameworks if f != source_framework]),
+        logger.info("Bridge", "Broadcast completed: %d successes, %d failures", success_count, failure_count, {
+            "total_targets": len(targets),
             "successes": success_count,
             "failures": failure_count
         })
         
         # Update metrics
-        metrics.increment_counter('messages_sent', success_count)
+        counter_deltas = {'messages_sent': success_count}
         if failure_count > 0:
-            metrics.increment_counter('errors', failure_count)
+            counter_deltas['errors'] = failure_count
+        if timeout_count > 0:
+            counter_deltas['broadcast_timeouts'] = timeout_count
+        metrics.increment_counter_many(counter_deltas)
                     
         return results
+    
+    def _framework_timeout(self, framework_name: str) -> float:
+        """Timeout in seconds for a single call to a framework."""
+        framework_config = self.config.get_framework(framework_name)
+        if framework_config is not None:
+            return framework_config.timeout
+        return self.config.default_timeout
 
     async def execute_intelligent_workflow(self, task_description: str, 
                                         required_capabilities: List[str] = None,
@@ -390,7 +424,7 @@ class AgentBridge:
         # Create a simple message for the task
         from .protocol import Message, MessageType
         task_message = Message(
-            id=str(uuid.uuid4()),
+            id=generate_correlation_id(),
             type=MessageType.TASK,
             source="intelligent_workflow",
             target=optimal_framework,
@@ -453,14 +487,17 @@ class AgentBridge:
         """Get the current status of the bridge."""
         from .logging import get_metrics_collector
         
-        metrics = get_metrics_collector()
-        
+        status = self._status_without_metrics()
+        status["metrics"] = get_metrics_collector().get_metrics()
+        return status
+    
+    def _status_without_metrics(self) -> Dict[str, Any]:
+        """Build every get_status() field except the metrics snapshot."""
         status = {
             "connected_frameworks": list(self.connected_frameworks.keys()),
             "adapter_count": len(self.adapters),
             "registry_status": self.adapter_registry.get_status(),
-            "config_loaded": bool(self.config),
-            "metrics": metrics.get_metrics()
+            "config_loaded": bool(self.config)
         }
         
         # Add workflow info if available
@@ -483,6 +520,18 @@ class AgentBridge:
         
         return status
 
+    def get_status_bytes(self) -> bytes:
+        """Get the current status of the bridge serialized as JSON bytes.
+        
+        The metrics part reuses the collector's cached serialized snapshot,
+        so only the rest of the status is encoded on each call.
+        """
+        from .logging import get_metrics_collector
+        
+        rest = dumps_json_bytes(self._status_without_metrics())
+        # rest is a non-empty JSON object, so splice metrics in after its opening brace
+        return b'{"metrics":' + get_metrics_collector().snapshot_bytes() + b',' + rest[1:]
+
     async def get_status_async(self) -> Dict[str, Any]:
         """Get the current status of the bridge (async version)."""
         from .logging import get_metrics_collector
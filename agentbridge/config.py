@@ -2,10 +2,11 @@
 Configuration management for AgentBridge
 """
 
+import asyncio
 import os
 import json
 import yaml
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Iterable, Optional, List, Callable
 from pathlib import Path
 from dataclasses import dataclass, field
 from .utils import load_config, save_config, merge_configs
@@ -60,18 +61,48 @@ class BridgeConfig:
     default_timeout: int = 30
     log_level: str = "INFO"
     enable_metrics: bool = False
+    # Position of each framework name in frameworks (first wins, as with a
+    # scan). Hits are checked against the list, so direct edits only cost a rescan.
+    _framework_positions: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def _rebuild_framework_index(self) -> None:
+        """Rebuild the name index from the current frameworks list."""
+        positions: Dict[str, int] = {}
+        for position, framework in enumerate(self.frameworks):
+            positions.setdefault(framework.name, position)
+        self._framework_positions = positions
     
     def add_framework(self, name: str, endpoint: str, **kwargs) -> None:
         """Add a framework to the configuration."""
         framework_config = FrameworkConfig(name=name, endpoint=endpoint, **kwargs)
         self.frameworks.append(framework_config)
+        self._framework_positions.setdefault(name, len(self.frameworks) - 1)
+    
+    def add_frameworks(self, specs: Iterable[Dict[str, Any]]) -> None:
+        """Add several frameworks, each given as a dict of add_framework() arguments.
+        
+        Every spec is validated before any framework is added.
+        """
+        framework_configs = [FrameworkConfig(**spec) for spec in specs]
+        start = len(self.frameworks)
+        self.frameworks.extend(framework_configs)
+        for offset, framework_config in enumerate(framework_configs):
+            self._framework_positions.setdefault(framework_config.name, start + offset)
     
     def get_framework(self, name: str) -> Optional[FrameworkConfig]:
         """Get a framework by name."""
-        for framework in self.frameworks:
+        position = self._framework_positions.get(name)
+        if position is not None and position < len(self.frameworks):
+            framework = self.frameworks[position]
             if framework.name == name:
                 return framework
-        return None
+        
+        # Miss or stale entry: frameworks was edited directly, so scan and reindex
+        self._rebuild_framework_index()
+        position = self._framework_positions.get(name)
+        return None if position is None else self.frameworks[position]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -7,7 +7,7 @@ import asyncio
 import logging
 from typing import Dict, List, Any, Callable, Awaitable, Union
 from dataclasses import dataclass, field
-from datetime import datetime
+import time
 from enum import Enum
 
 class EventType(str, Enum):
@@ -27,8 +27,12 @@ class Event:
     type: str
     payload: Dict[str, Any]
     source: str
-    timestamp: float = field(default_factory=lambda: datetime.now().timestamp())
-    id: str = field(default_factory=lambda: f"evt_{datetime.now().timestamp()}")
+    timestamp: float = field(default_factory=time.time)
+    id: str = ""  # Derived from the timestamp unless given
+    
+    def __post_init__(self):
+        if not self.id:
+            self.id = f"evt_{self.timestamp}"
 
 # Type alias for event handlers
 EventHandler = Callable[[Event], Awaitable[None]]
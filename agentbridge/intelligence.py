@@ -83,24 +83,45 @@ class IntelligentRouter:
                                 available_frameworks: List[str],
                                 strategy: OptimizationStrategy = OptimizationStrategy.PERFORMANCE_BASED) -> str:
         """Route task to optimal framework based on intelligence"""
-        predictions = {}
+        predictions = self._predict_all(task_description, available_frameworks)
+        best_framework = self._select_framework(predictions, strategy)
         
-        for framework in available_frameworks:
-            prediction = self.predictor.predict_performance(framework, task_description)
-            predictions[framework] = prediction
-            
+        self.logger.info("IntelligentRouter", "Routed task '%s' to %s using %s strategy", task_description, best_framework, strategy.value)
+        return best_framework
+    
+    async def route_with_strategies(self, task_description: str,
+                                    available_frameworks: List[str],
+                                    strategies: List[OptimizationStrategy]) -> Dict[OptimizationStrategy, str]:
+        """Route a task under several strategies, predicting performance only once"""
+        predictions = self._predict_all(task_description, available_frameworks)
+        return {
+            strategy: self._select_framework(predictions, strategy)
+            for strategy in strategies
+        }
+    
+    def _predict_all(self, task_description: str,
+                     available_frameworks: List[str]) -> Dict[str, Dict[str, float]]:
+        """Predict performance of each available framework for a task"""
+        return {
+            framework: self.predictor.predict_performance(framework, task_description)
+            for framework in available_frameworks
+        }
+    
+    def _select_framework(self, predictions: Dict[str, Dict[str, float]],
+                          strategy: OptimizationStrategy) -> str:
+        """Pick the best framework from predictions under a strategy"""
         if strategy == OptimizationStrategy.PERFORMANCE_BASED:
             # Choose framework with best predicted success rate
-            best_framework = max(predictions.keys(), 
-                              key=lambda f: predictions[f]['predicted_success_rate'])
+            return max(predictions.keys(), 
+                       key=lambda f: predictions[f]['predicted_success_rate'])
         elif strategy == OptimizationStrategy.COST_OPTIMIZED:
             # Choose framework with lowest predicted cost
-            best_framework = min(predictions.keys(), 
-                              key=lambda f: predictions[f]['predicted_cost'])
+            return min(predictions.keys(), 
+                       key=lambda f: predictions[f]['predicted_cost'])
         elif strategy == OptimizationStrategy.LOAD_BALANCED:
             # Choose framework with lowest current load (simplified)
-            best_framework = min(predictions.keys(), 
-                              key=lambda f: predictions[f]['predicted_duration'])
+            return min(predictions.keys(), 
+                       key=lambda f: predictions[f]['predicted_duration'])
         else:  # PREDICTIVE
             # Use weighted score considering all factors
             scores = {}
@@ -110,10 +131,7 @@ class IntelligentRouter:
                 score = pred['predicted_success_rate'] * 100 - pred['predicted_cost'] * 10
                 scores[framework] = score
             
-            best_framework = max(scores.keys(), key=lambda f: scores[f])
-        
-        self.logger.info("IntelligentRouter", f"Routed task '{task_description}' to {best_framework} using {strategy.value} strategy")
-        return best_framework
+            return max(scores.keys(), key=lambda f: scores[f])
 
 
 class AdaptiveOptimizer:
@@ -201,6 +219,14 @@ class IntelligenceManager:
         
         return optimal_framework
     
+    async def optimize_task_execution_multi(self, task_description: str,
+                                            available_frameworks: List[str],
+                                            strategies: List[OptimizationStrategy]) -> Dict[OptimizationStrategy, str]:
+        """Find the optimal framework for a task under each of several strategies"""
+        return await self.intelligent_router.route_with_strategies(
+            task_description, available_frameworks, strategies
+        )
+    
     async def record_task_outcome(self, framework: str, task_type: str, 
                                 duration: float, success: bool, cost: float):
         """Record task outcome for learning"""
@@ -2,15 +2,24 @@
 Enhanced logging and monitoring for AgentBridge
 """
 
+import asyncio
+import atexit
+import contextvars
 import logging
+import math
+import os
+import queue
 import sys
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from enum import Enum
 from dataclasses import dataclass
 import json
 import traceback
 from pathlib import Path
+from array import array
+from .utils import dumps_json_bytes
 
 
 class LogLevel(Enum):
@@ -21,6 +30,16 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+# Severity order used for level filtering
+_LEVEL_ORDER = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+    LogLevel.CRITICAL: 4
+}
+
+
 @dataclass
 class LogEntry:
     """Structure for a log entry."""
@@ -53,7 +72,10 @@ class AgentBridgeLogger:
         self.name = name
         self.level = level
         self.handlers: list = []
-        self.correlation_stack: list = []
+        # Per-context so IDs follow asyncio tasks across awaits
+        self._correlation_ids: contextvars.ContextVar = contextvars.ContextVar(
+            f"agentbridge_correlation_ids_{name}", default=()
+        )
         
         # Set up basic logging
         self.logger = logging.getLogger(name)
@@ -73,39 +95,58 @@ class AgentBridgeLogger:
         self.level = level
         self.logger.setLevel(getattr(logging, level.value))
     
-    def push_correlation_id(self, correlation_id: str):
-        """Push a correlation ID onto the stack."""
-        self.correlation_stack.append(correlation_id)
+    @property
+    def correlation_stack(self) -> list:
+        """Correlation IDs pushed in the current context, innermost last."""
+        return list(self._correlation_ids.get())
     
-    def pop_correlation_id(self) -> Optional[str]:
-        """Pop a correlation ID from the stack."""
-        if self.correlation_stack:
-            return self.correlation_stack.pop()
-        return None
+    def push_correlation_id(self, correlation_id: str) -> contextvars.Token:
+        """Push a correlation ID for the current context.
+        
+        Returns a token that can be passed to pop_correlation_id().
+        """
+        return self._correlation_ids.set(self._correlation_ids.get() + (correlation_id,))
+    
+    def pop_correlation_id(self, token: Optional[contextvars.Token] = None) -> Optional[str]:
+        """Pop a correlation ID for the current context.
+        
+        With a token from push_correlation_id(), restores the IDs to what
+        they were before that push; otherwise pops the innermost ID.
+        """
+        stack = self._correlation_ids.get()
+        if token is not None:
+            self._correlation_ids.reset(token)
+        elif stack:
+            self._correlation_ids.set(stack[:-1])
+        return stack[-1] if stack else None
     
     def get_current_correlation_id(self) -> Optional[str]:
         """Get the current correlation ID."""
-        if self.correlation_stack:
-            return self.correlation_stack[-1]
-        return None
+        stack = self._correlation_ids.get()
+        return stack[-1] if stack else None
     
     def _should_log(self, level: LogLevel) -> bool:
         """Check if a log level should be logged."""
-        level_values = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3,
-            LogLevel.CRITICAL: 4
-        }
-        return level_values[level] >= level_values[self.level]
+        return _LEVEL_ORDER[level] >= _LEVEL_ORDER[self.level]
     
     def _log(self, level: LogLevel, source: str, message: str, 
+             args: tuple = (),
              details: Optional[Dict[str, Any]] = None, 
              correlation_id: Optional[str] = None):
-        """Internal logging method."""
+        """Internal logging method.
+        
+        ``message % args`` is only formatted once the level check has
+        passed. A trailing dict in ``args`` is taken as the details, so
+        ``info(source, message, details)`` keeps working.
+        """
         if not self._should_log(level):
             return
+        
+        if details is None and args and isinstance(args[-1], dict):
+            details = args[-1]
+            args = args[:-1]
+        if args:
+            message = message % args
             
         # Use provided correlation ID or get from stack
         corr_id = correlation_id or self.get_current_correlation_id()
@@ -129,25 +170,25 @@ class AgentBridgeLogger:
         for handler in self.handlers:
             handler.handle(log_entry)
     
-    def debug(self, source: str, message: str, details: Optional[Dict[str, Any]] = None):
+    def debug(self, source: str, message: str, *args: Any, details: Optional[Dict[str, Any]] = None):
         """Log a debug message."""
-        self._log(LogLevel.DEBUG, source, message, details)
+        self._log(LogLevel.DEBUG, source, message, args, details)
     
-    def info(self, source: str, message: str, details: Optional[Dict[str, Any]] = None):
+    def info(self, source: str, message: str, *args: Any, details: Optional[Dict[str, Any]] = None):
         """Log an info message."""
-        self._log(LogLevel.INFO, source, message, details)
+        self._log(LogLevel.INFO, source, message, args, details)
     
-    def warning(self, source: str, message: str, details: Optional[Dict[str, Any]] = None):
+    def warning(self, source: str, message: str, *args: Any, details: Optional[Dict[str, Any]] = None):
         """Log a warning message."""
-        self._log(LogLevel.WARNING, source, message, details)
+        self._log(LogLevel.WARNING, source, message, args, details)
     
-    def error(self, source: str, message: str, details: Optional[Dict[str, Any]] = None):
+    def error(self, source: str, message: str, *args: Any, details: Optional[Dict[str, Any]] = None):
         """Log an error message."""
-        self._log(LogLevel.ERROR, source, message, details)
+        self._log(LogLevel.ERROR, source, message, args, details)
     
-    def critical(self, source: str, message: str, details: Optional[Dict[str, Any]] = None):
+    def critical(self, source: str, message: str, *args: Any, details: Optional[Dict[str, Any]] = None):
         """Log a critical message."""
-        self._log(LogLevel.CRITICAL, source, message, details)
+        self._log(LogLevel.CRITICAL, source, message, args, details)
     
     def exception(self, source: str, message: str, 
                   exc_info: Optional[Exception] = None, 
@@ -165,32 +206,101 @@ class AgentBridgeLogger:
         if details:
             error_details.update(details)
         
-        self.error(source, message, error_details)
+        self.error(source, message, details=error_details)
+
+
+# Queued by FileLogHandler.close() to stop the writer thread
+_STOP_WRITER = object()
 
 
 class FileLogHandler:
-    """Log handler that writes to a file."""
+    """Log handler that writes to a file.
+    
+    Entries are queued and written by a background thread, which batches
+    everything that has accumulated into a single write, so logging from
+    the event loop never waits on disk I/O. Call close() (or await
+    aclose() from async code) to flush pending entries.
+    """
+    
+    _BATCH_SIZE = 512  # Max entries per write
     
     def __init__(self, filepath: str, max_size_mb: int = 10):
         self.filepath = Path(filepath)
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.ensure_file_exists()
+        
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write_loop, name=f"FileLogHandler-{self.filepath.name}", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
     
     def ensure_file_exists(self):
-        """Ensure the log file exists."""
-        if not self.filepath.parent.exists():
-            self.filepath.parent.mkdir(parents=True, exist_ok=True)
-        if not self.filepath.exists():
-            self.filepath.touch()
+        """Ensure the log file and its directory exist."""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.filepath.touch(exist_ok=True)
     
     def handle(self, log_entry: LogEntry):
         """Handle a log entry."""
-        # Rotate file if too large
-        if self.filepath.stat().st_size > self.max_size_bytes:
-            self.rotate_log()
-        
-        with open(self.filepath, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry.to_dict()) + '\n')
+        if not self._closed:
+            self._queue.put_nowait(log_entry)
+    
+    def _write_loop(self):
+        """Write queued entries to the file until close() is called."""
+        f = open(self.filepath, 'ab', buffering=64 * 1024)
+        # Track the file size here rather than stat()ing before every write
+        size = f.seek(0, 2)
+        try:
+            stopping = False
+            while not stopping:
+                entries = [self._queue.get()]
+                while len(entries) < self._BATCH_SIZE:
+                    try:
+                        entries.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                lines = []
+                for entry in entries:
+                    if entry is _STOP_WRITER:
+                        stopping = True
+                    else:
+                        try:
+                            lines.append(json.dumps(entry.to_dict(), default=str) + '\n')
+                        except (TypeError, ValueError) as e:
+                            # e.g. circular details; drop the entry, keep the writer alive
+                            sys.stderr.write(f"FileLogHandler: dropped log entry that could not be serialized: {e}\n")
+                if not lines:
+                    continue
+                
+                # Rotate file if too large
+                if size > self.max_size_bytes:
+                    f.close()
+                    self.rotate_log()
+                    f = open(self.filepath, 'ab', buffering=64 * 1024)
+                    size = 0
+                
+                data = ''.join(lines).encode('utf-8')
+                f.write(data)
+                f.flush()
+                size += len(data)
+        finally:
+            f.close()
+    
+    def close(self):
+        """Write any pending entries and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_STOP_WRITER)
+        self._writer.join()
+    
+    async def aclose(self):
+        """Like close(), without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
     
     def rotate_log(self):
         """Rotate the log file."""
@@ -200,34 +310,175 @@ class FileLogHandler:
         self.filepath.rename(backup_path)
 
 
-class MetricsCollector:
-    """Collect metrics about bridge operations."""
+# Timer samples kept per thread; older samples are dropped
+DEFAULT_TIMER_WINDOW = int(os.environ.get("AGENTBRIDGE_TIMER_WINDOW", "10000"))
+
+
+class _MetricsShard:
+    """Counters and timer samples recorded by a single thread."""
+    
+    __slots__ = ('counters', 'timers')
     
     def __init__(self):
-        self.counters = {
-            'messages_sent': 0,
-            'messages_received': 0,
-            'errors': 0,
-            'connections': 0,
-            'disconnections': 0,
-        }
-        self.timers = {
-            'avg_response_time': [],
-            'avg_processing_time': [],
+        self.counters: Dict[str, int] = {}
+        self.timers: Dict[str, array] = {}  # Samples as integer nanoseconds
+
+
+class MetricsCollector:
+    """Collect metrics about bridge operations.
+    
+    Counters and timers are recorded into a per-thread shard, so the hot
+    path is a plain dict update with no lock and no lost increments when
+    several threads record at once. The ``counters`` and ``timers``
+    properties fold the shards together on read and return new dicts, so
+    editing what they return has no effect. Assign to the properties to
+    replace their contents, or call reset() to start over.
+    
+    Every update bumps a generation number, and get_metrics() reuses its
+    last snapshot until that changes, handing each caller its own copy.
+    
+    Each thread keeps only its most recent ``timer_window`` samples per
+    timer, so timer statistics cover a recent window and memory stays
+    bounded however long the process runs.
+    """
+    
+    _DEFAULT_COUNTERS = ('messages_sent', 'messages_received', 'errors', 'connections', 'disconnections')
+    _DEFAULT_TIMERS = ('avg_response_time', 'avg_processing_time')
+    
+    def __init__(self, timer_window: int = DEFAULT_TIMER_WINDOW):
+        self.timer_window = timer_window
+        self._local = threading.local()
+        self._shards: list = []
+        self._shards_lock = threading.Lock()  # Only taken when a thread records for the first time
+        self.framework_stats = {}
+        # Bumped on every update (unsynchronized, it's only an invalidation hint)
+        self._generation = 0
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_generation = -1
+        self._snapshot_bytes: Optional[bytes] = None
+        self._snapshot_bytes_generation = -1
+    
+    def _shard(self) -> _MetricsShard:
+        """Get the calling thread's shard, creating it on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _MetricsShard()
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+    
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Current counter totals across all threads."""
+        totals = dict.fromkeys(self._DEFAULT_COUNTERS, 0)
+        for shard in list(self._shards):
+            for counter_name, value in list(shard.counters.items()):
+                totals[counter_name] = totals.get(counter_name, 0) + value
+        return totals
+    
+    @counters.setter
+    def counters(self, values: Dict[str, int]):
+        """Replace every counter's total with the given values."""
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.counters.clear()
+        self._shard().counters.update(values)
+        self._generation += 1
+    
+    @property
+    def timers(self) -> Dict[str, list]:
+        """Recorded timing values in seconds across all threads."""
+        return {
+            timer_name: [sample / 1e9 for sample in samples]
+            for timer_name, samples in self._timer_samples().items()
         }
+    
+    @timers.setter
+    def timers(self, values: Dict[str, Sequence[float]]):
+        """Replace every timer's samples with the given values in seconds."""
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.timers.clear()
+        timers = self._shard().timers
+        for timer_name, timer_values in values.items():
+            samples = array('q', (round(value * 1_000_000_000) for value in timer_values if math.isfinite(value)))
+            if len(samples) > self.timer_window:
+                self._trim(samples)
+            timers[timer_name] = samples
+        self._generation += 1
+    
+    def reset(self):
+        """Clear all counters, timer samples and framework stats."""
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.counters.clear()
+                shard.timers.clear()
         self.framework_stats = {}
+        self._generation += 1
+    
+    def _timer_samples(self) -> Dict[str, list]:
+        """Recorded timing values in nanoseconds across all threads."""
+        values = {timer_name: [] for timer_name in self._DEFAULT_TIMERS}
+        window = self.timer_window
+        for shard in list(self._shards):
+            for timer_name, samples in list(shard.timers.items()):
+                values.setdefault(timer_name, []).extend(samples[-window:])
+        return values
     
     def increment_counter(self, counter_name: str, value: int = 1):
         """Increment a counter."""
-        if counter_name not in self.counters:
-            self.counters[counter_name] = 0
-        self.counters[counter_name] += value
+        counters = self._shard().counters
+        counters[counter_name] = counters.get(counter_name, 0) + value
+        self._generation += 1
+    
+    def increment_counter_many(self, deltas: Dict[str, int]):
+        """Increment several counters at once."""
+        counters = self._shard().counters
+        for counter_name, value in deltas.items():
+            counters[counter_name] = counters.get(counter_name, 0) + value
+        self._generation += 1
     
     def record_timer(self, timer_name: str, value: float):
-        """Record a timing value."""
-        if timer_name not in self.timers:
-            self.timers[timer_name] = []
-        self.timers[timer_name].append(value)
+        """Record a timing value in seconds.
+        
+        Samples are stored as integer nanoseconds, so NaN and infinite
+        values can't be represented and are skipped.
+        """
+        if not math.isfinite(value):
+            return
+        self.record_timer_ns(timer_name, round(value * 1_000_000_000))
+    
+    def record_timer_ns(self, timer_name: str, value_ns: int):
+        """Record a timing value in integer nanoseconds, e.g. a perf_counter_ns() delta."""
+        timers = self._shard().timers
+        samples = timers.get(timer_name)
+        if samples is None:
+            samples = timers[timer_name] = array('q')
+        samples.append(value_ns)
+        if len(samples) >= 2 * self.timer_window:
+            self._trim(samples)
+        self._generation += 1
+    
+    def record_timer_batch(self, timer_name: str, values: Sequence[float]):
+        """Record several timing values in seconds at once, skipping non-finite ones."""
+        timers = self._shard().timers
+        samples = timers.get(timer_name)
+        if samples is None:
+            samples = timers[timer_name] = array('q')
+        samples.extend(round(value * 1_000_000_000) for value in values if math.isfinite(value))
+        if len(samples) >= 2 * self.timer_window:
+            self._trim(samples)
+        self._generation += 1
+    
+    def _trim(self, samples: array):
+        """Drop all but the newest timer_window samples.
+        
+        Samples are trimmed only once they reach twice the window, which
+        keeps the cost of recording amortized O(1).
+        """
+        del samples[:len(samples) - self.timer_window]
     
     def update_framework_stats(self, framework: str, operation: str, success: bool = True):
         """Update stats for a specific framework."""
@@ -243,22 +494,29 @@ class MetricsCollector:
             self.framework_stats[framework]['successes'] += 1
         else:
             self.framework_stats[framework]['failures'] += 1
+        self._generation += 1
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get all collected metrics."""
+        # Read the generation before folding, so updates racing with the
+        # fold invalidate this snapshot
+        generation = self._generation
+        if self._snapshot is not None and self._snapshot_generation == generation:
+            return self._copy_snapshot(self._snapshot)
+        
         metrics = {
-            'counters': self.counters.copy(),
+            'counters': self.counters,
             'timers': {}
         }
         
-        # Calculate averages for timers
-        for timer_name, values in self.timers.items():
+        # Calculate averages for timers; sums stay exact in integer nanoseconds
+        for timer_name, values in self._timer_samples().items():
             if values:
                 metrics['timers'][timer_name] = {
                     'count': len(values),
-                    'average': sum(values) / len(values),
-                    'min': min(values),
-                    'max': max(values)
+                    'average': sum(values) / len(values) / 1e9,
+                    'min': min(values) / 1e9,
+                    'max': max(values) / 1e9
                 }
             else:
                 metrics['timers'][timer_name] = {
@@ -268,8 +526,33 @@ class MetricsCollector:
                     'max': 0
                 }
         
-        metrics['framework_stats'] = self.framework_stats.copy()
-        return metrics
+        metrics['framework_stats'] = {
+            framework: dict(stats) for framework, stats in self.framework_stats.items()
+        }
+        self._snapshot = metrics
+        self._snapshot_generation = generation
+        return self._copy_snapshot(metrics)
+    
+    @staticmethod
+    def _copy_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a snapshot down to its per-timer and per-framework dicts.
+        
+        The cached snapshot is never handed out, so callers can't corrupt it.
+        Copying is far cheaper than folding the shards again.
+        """
+        return {
+            'counters': dict(snapshot['counters']),
+            'timers': {name: dict(stats) for name, stats in snapshot['timers'].items()},
+            'framework_stats': {name: dict(stats) for name, stats in snapshot['framework_stats'].items()},
+        }
+    
+    def snapshot_bytes(self) -> bytes:
+        """Get all collected metrics serialized as JSON bytes."""
+        generation = self._generation
+        if self._snapshot_bytes is None or self._snapshot_bytes_generation != generation:
+            self._snapshot_bytes = dumps_json_bytes(self.get_metrics())
+            self._snapshot_bytes_generation = generation
+        return self._snapshot_bytes
 
 
 # Global logger instance
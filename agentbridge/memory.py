@@ -8,7 +8,7 @@ import math
 import os
 import sqlite3
 from typing import List, Dict, Any, Optional, Tuple, Union
-from datetime import datetime
+import time
 from dataclasses import dataclass, field, asdict
 
 @dataclass
@@ -17,8 +17,12 @@ class MemoryEntry:
     content: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     embedding: Optional[List[float]] = None
-    timestamp: float = field(default_factory=lambda: datetime.now().timestamp())
-    id: str = field(default_factory=lambda: f"mem_{datetime.now().timestamp()}_{os.urandom(4).hex()}")
+    timestamp: float = field(default_factory=time.time)
+    id: str = ""  # Derived from the timestamp unless given
+    
+    def __post_init__(self):
+        if not self.id:
+            self.id = f"mem_{self.timestamp}_{os.urandom(4).hex()}"
 
 class VectorMemory:
     """
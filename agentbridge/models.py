@@ -79,6 +79,20 @@ class ModelRouter:
         self._best_model_cache: Dict[str, Optional[ModelSpec]] = {}
         self._cache_timestamps: Dict[str, float] = {}
         self._cache_ttl = 300  # 5 minutes TTL
+        # Registered models per capability, keyed by model ID in registration order.
+        # Re-register a model after changing its capabilities.
+        self._models_by_capability: Dict[ModelCapability, Dict[str, ModelSpec]] = {}
+    
+    def _index_model(self, model_spec: ModelSpec):
+        """Add a model to the capability index."""
+        for capability in model_spec.capabilities:
+            self._models_by_capability.setdefault(capability, {})[model_spec.id] = model_spec
+    
+    def _rebuild_capability_index(self):
+        """Rebuild the capability index from the registered models."""
+        self._models_by_capability = {}
+        for model_spec in self.models.values():
+            self._index_model(model_spec)
     
     def _invalidate_cache(self):
         """Invalidate cache when models are registered/unregistered"""
@@ -88,7 +102,13 @@ class ModelRouter:
     
     def register_model(self, model_spec: ModelSpec):
         """Register a new model with the router"""
+        replacing = model_spec.id in self.models
         self.models[model_spec.id] = model_spec
+        if replacing:
+            # Keep the index in registration order, as a rescan would give
+            self._rebuild_capability_index()
+        else:
+            self._index_model(model_spec)
         self.stats[model_spec.id] = ModelUsageStats(model_id=model_spec.id)
         # Invalidate cache since models changed
         self._invalidate_cache()
@@ -97,7 +117,8 @@ class ModelRouter:
     def unregister_model(self, model_id: str):
         """Unregister a model"""
         if model_id in self.models:
-            del self.models[model_id]
+            for capability in self.models.pop(model_id).capabilities:
+                self._models_by_capability.get(capability, {}).pop(model_id, None)
             if model_id in self.stats:
                 del self.stats[model_id]
             # Invalidate cache since models changed
@@ -116,8 +137,8 @@ class ModelRouter:
                     return self._capability_cache[cache_key]
         
         # Compute result
-        result = [model for model in self.models.values() 
-                 if capability in model.capabilities and model.is_active]
+        result = [model for model in self._models_by_capability.get(capability, {}).values()
+                  if model.is_active]
         
         # Cache the result
         self._capability_cache[cache_key] = result
@@ -140,11 +161,15 @@ class ModelRouter:
                 if current_time - self._cache_timestamps[cache_key] < self._cache_ttl:
                     return self._best_model_cache[cache_key]
         
-        candidates = list(self.models.values())
-        
-        # Filter by capabilities
-        for cap in capabilities:
-            candidates = [model for model in candidates if cap in model.capabilities]
+        # Filter by capabilities: walk the smallest matching set and check
+        # the others by model ID
+        if capabilities:
+            matching = [self._models_by_capability.get(cap, {}) for cap in capabilities]
+            smallest = min(matching, key=len)
+            candidates = [model for model_id, model in smallest.items()
+                          if all(model_id in models for models in matching)]
+        else:
+            candidates = list(self.models.values())
         
         # Filter by token capacity if specified
         if max_tokens_needed:
@@ -190,7 +215,7 @@ class ModelRouter:
         
         # This would normally call the actual model API
         # For now, return a mock response
-        self.logger.info("ModelRouter", f"Routing request to model: {model.id}")
+        self.logger.info("ModelRouter", "Routing request to model: %s", model.id)
         
         return {
             "model_id": model.id,
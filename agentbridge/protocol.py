@@ -7,6 +7,8 @@ from typing import Dict, Any, Optional, Union
 from enum import Enum
 import json
 
+from .utils import add_slots
+
 
 class MessageType(Enum):
     """Types of messages that can be exchanged between agents."""
@@ -20,6 +22,7 @@ class MessageType(Enum):
     METADATA_RESPONSE = "metadata_response"
 
 
+@add_slots
 @dataclass
 class Message:
     """Standardized message structure for agent communication."""
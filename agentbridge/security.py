@@ -6,8 +6,8 @@ import jwt
 import hashlib
 import secrets
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
-from cryptography.fernet import Fernet
+from typing import Dict, Any, Optional, List, FrozenSet, Tuple
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
@@ -43,7 +43,11 @@ class SecurityManager:
         self.tokens: Dict[str, Dict[str, Any]] = {}
         self.roles: Dict[str, List[ResourcePermission]] = {}  # Role-based permissions
         self.user_roles: Dict[str, List[str]] = {}  # Token to roles mapping
+        # Frozen copies of the config's framework/origin lists for O(1) checks,
+        # alongside the list each was built from
+        self._lookup_sets: Dict[str, Tuple[List[str], FrozenSet[str]]] = {}
         self._initialize_security()
+        self.refresh_lookup_sets()
     
     def _initialize_security(self):
         """Initialize security components based on configuration."""
@@ -52,7 +56,7 @@ class SecurityManager:
             for token in self.config.security.auth_tokens:
                 # Add token with default permissions
                 self.tokens[token] = {
-                    'permissions': ['read', 'write'],
+                    'permissions': frozenset(['read', 'write']),
                     'expires_at': None,
                     'created_at': datetime.now(),
                     'roles': []  # No roles initially
@@ -61,7 +65,7 @@ class SecurityManager:
         # Generate encryption key if needed
         if self.config.security.encryption_enabled:
             self.encryption_key = self._generate_encryption_key()
-            self.cipher_suite = Fernet(self.encryption_key)
+            self.cipher_suite = AESGCM(self.encryption_key)
         else:
             self.encryption_key = None
             self.cipher_suite = None
@@ -83,15 +87,16 @@ class SecurityManager:
     
     def has_resource_permission(self, token: str, resource: str, action: str) -> bool:
         """Check if a token has permission to perform an action on a resource."""
-        if token not in self.tokens:
+        token_info = self.tokens.get(token)
+        if token_info is None:
             return False
         
         # Check direct permissions
-        if action in self.tokens[token].get('permissions', []):
+        if action in token_info.get('permissions', ()):
             return True
         
         # Check role-based permissions
-        for role_name in self.tokens[token].get('roles', []):
+        for role_name in token_info.get('roles', []):
             if role_name in self.roles:
                 for permission in self.roles[role_name]:
                     if permission.resource == resource and action in permission.actions:
@@ -101,50 +106,65 @@ class SecurityManager:
     
     def _generate_encryption_key(self) -> bytes:
         """Generate a new encryption key."""
-        return Fernet.generate_key()
+        return AESGCM.generate_key(bit_length=256)
     
     def generate_token(self, permissions: List[str] = None, expires_in_hours: int = 24) -> str:
         """Generate a new authentication token."""
-        token = secrets.token_urlsafe(32)
-        expires_at = datetime.now() + timedelta(hours=expires_in_hours) if expires_in_hours else None
+        return self.generate_tokens(1, permissions, expires_in_hours)[0]
+    
+    def generate_tokens(self, count: int, permissions: List[str] = None,
+                        expires_in_hours: int = 24) -> List[str]:
+        """Generate several authentication tokens sharing the same permissions.
         
-        self.tokens[token] = {
-            'permissions': permissions or ['read', 'write'],
-            'expires_at': expires_at,
-            'created_at': datetime.now(),
-            'roles': []  # Initialize roles for new tokens
-        }
+        Entropy for all tokens is read in a single call, and each token has
+        the same format as secrets.token_urlsafe(32).
+        """
+        entropy = secrets.token_bytes(32 * count)
+        tokens = [
+            base64.urlsafe_b64encode(entropy[offset:offset + 32]).rstrip(b'=').decode('ascii')
+            for offset in range(0, 32 * count, 32)
+        ]
         
-        return token
-    
-    def authenticate(self, token: str) -> bool:
-        """Authenticate a token."""
-        if not self.config.security.require_auth:
-            return True  # Authentication not required
+        now = datetime.now()
+        expires_at = now + timedelta(hours=expires_in_hours) if expires_in_hours else None
+        token_permissions = frozenset(permissions or ['read', 'write'])
         
-        if token not in self.tokens:
-            raise AuthenticationError("Invalid token")
+        self.tokens.update(
+            (token, {
+                'permissions': token_permissions,
+                'expires_at': expires_at,
+                'created_at': now,
+                'roles': []  # Initialize roles for new tokens
+            })
+            for token in tokens
+        )
         
-        token_info = self.tokens[token]
+        return tokens
+    
+    def _get_token_info(self, token: str) -> Dict[str, Any]:
+        """Look up a token, raising AuthenticationError if it is unknown or expired."""
+        token_info = self.tokens.get(token)
+        if token_info is None:
+            raise AuthenticationError("Invalid token")
         
         # Check if token has expired
         if token_info['expires_at'] and datetime.now() > token_info['expires_at']:
             del self.tokens[token]  # Remove expired token
             raise AuthenticationError("Token has expired")
         
+        return token_info
+    
+    def authenticate(self, token: str) -> bool:
+        """Authenticate a token."""
+        if not self.config.security.require_auth:
+            return True  # Authentication not required
+        
+        self._get_token_info(token)
         return True
     
     def authorize(self, token: str, permission: str, resource: str = None) -> bool:
         """Authorize a token for a specific permission."""
-        if token not in self.tokens:
-            raise AuthenticationError("Invalid token")
-        
-        token_info = self.tokens[token]
-        
-        # Check if token has expired
-        if token_info['expires_at'] and datetime.now() > token_info['expires_at']:
-            del self.tokens[token]  # Remove expired token
-            raise AuthenticationError("Token has expired")
+        token_info = self._get_token_info(token)
         
         # If resource is specified, use resource-based permission check
         if resource:
@@ -163,8 +183,10 @@ class SecurityManager:
             return data  # Return as-is if encryption not enabled
         
         try:
-            encrypted_bytes = self.cipher_suite.encrypt(data.encode())
-            return base64.b64encode(encrypted_bytes).decode()
+            # A fresh 96-bit nonce per message, sent in front of the ciphertext
+            nonce = os.urandom(12)
+            encrypted_bytes = self.cipher_suite.encrypt(nonce, data.encode(), None)
+            return base64.b64encode(nonce + encrypted_bytes).decode()
         except Exception as e:
             raise Exception(f"Encryption failed: {str(e)}")
     
@@ -175,7 +197,7 @@ class SecurityManager:
         
         try:
             encrypted_bytes = base64.b64decode(encrypted_data.encode())
-            decrypted_bytes = self.cipher_suite.decrypt(encrypted_bytes)
+            decrypted_bytes = self.cipher_suite.decrypt(encrypted_bytes[:12], encrypted_bytes[12:], None)
             return decrypted_bytes.decode()
         except Exception as e:
             raise Exception(f"Decryption failed: {str(e)}")
@@ -188,16 +210,36 @@ class SecurityManager:
         """Verify data integrity against hash."""
         return self.hash_data(data) == expected_hash
     
+    def _lookup_set(self, name: str, values: List[str]) -> FrozenSet[str]:
+        """Get the frozenset of a config list, rebuilt if the list was replaced."""
+        cached = self._lookup_sets.get(name)
+        if cached is None or cached[0] is not values:
+            cached = (values, frozenset(values))
+            self._lookup_sets[name] = cached
+        return cached[1]
+    
+    def refresh_lookup_sets(self):
+        """Rebuild the trusted framework and origin sets from config.
+        
+        Assigning a new list to allowed_frameworks or allowed_origins is
+        picked up automatically; call this after editing either list in place.
+        """
+        security = self.config.security
+        self._lookup_sets = {
+            'frameworks': (security.allowed_frameworks, frozenset(security.allowed_frameworks)),
+            'origins': (security.allowed_origins, frozenset(security.allowed_origins)),
+        }
+    
     def is_trusted_framework(self, framework_name: str) -> bool:
         """Check if a framework is in the trusted list."""
         if not self.config.security.trusted_frameworks_only:
             return True  # All frameworks trusted if not enforcing trusted list
         
-        return framework_name in self.config.security.allowed_frameworks
+        return framework_name in self._lookup_set('frameworks', self.config.security.allowed_frameworks)
     
     def validate_origin(self, origin: str) -> bool:
         """Validate request origin against allowed origins."""
-        allowed_origins = self.config.security.allowed_origins
+        allowed_origins = self._lookup_set('origins', self.config.security.allowed_origins)
         
         if "*" in allowed_origins:
             return True  # Allow all origins
@@ -13,11 +13,85 @@ from .protocol import Message, MessageType
 from .security import SecurityMiddleware, AuthenticationError, AuthorizationError
 
 
+async def _handle_send(bridge: AgentBridge, message_dict: Dict[str, Any]):
+    """Handle a WebSocket 'send_message' action."""
+    source = message_dict.get('source')
+    target = message_dict.get('target')
+    
+    # Security check: verify if frameworks are trusted
+    if not bridge.security_manager.is_trusted_framework(source):
+        return {
+            "type": "error",
+            "message": f"Source framework {source} is not trusted"
+        }
+        
+    if not bridge.security_manager.is_trusted_framework(target):
+        return {
+            "type": "error",
+            "message": f"Target framework {target} is not trusted"
+        }
+    
+    content = message_dict.get('content', {})
+    
+    # Create a message object
+    message = Message(
+        type=MessageType[message_dict.get('type', 'TASK_REQUEST').upper()],
+        source=source,
+        target=target,
+        content=content,
+        timestamp=time.time(),
+        correlation_id=message_dict.get('correlation_id'),
+        reply_to=message_dict.get('reply_to'),
+        metadata=message_dict.get('metadata')
+    )
+    
+    # Send message through bridge
+    result = await bridge.send_message(source, target, message)
+    
+    return {
+        "type": "response",
+        "correlation_id": message.correlation_id,
+        "result": result
+    }
+
+
+async def _handle_status(bridge: AgentBridge, message_dict: Dict[str, Any]):
+    """Handle a WebSocket 'subscribe_status' action."""
+    # Security check: verify read permission
+    if bridge.config.security.require_auth:
+        token = message_dict.get('token')
+        if token:
+            try:
+                bridge.security_manager.authenticate(token)
+                bridge.security_manager.authorize(token, 'read')
+            except (AuthenticationError, AuthorizationError) as e:
+                return {
+                    "type": "error",
+                    "message": str(e)
+                }
+    
+    # Send current status
+    return {
+        "type": "status_update",
+        "status": bridge.get_status()
+    }
+
+
+# WebSocket actions mapped to their handlers
+_WS_ACTIONS = {
+    'send_message': _handle_send,
+    'subscribe_status': _handle_status,
+}
+
+# Most requests a single batched WebSocket frame may carry
+MAX_WS_BATCH_SIZE = 100
+
+
 def create_app(agent_bridge: AgentBridge):
     """Create and configure the FastAPI application."""
     # Import FastAPI here to defer loading of dependencies
     try:
-        from fastapi import FastAPI, WebSocket, HTTPException, BackgroundTasks, Request
+        from fastapi import FastAPI, WebSocket, HTTPException, BackgroundTasks, Request, Response
         from fastapi.middleware.cors import CORSMiddleware
     except ImportError:
         raise ImportError("FastAPI is required to run the server. Please install it with 'pip install fastapi uvicorn'")
@@ -37,6 +111,15 @@ def create_app(agent_bridge: AgentBridge):
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    
+    # Compress larger responses; Brotli when available (it falls back to gzip
+    # for clients that don't accept br), plain gzip otherwise
+    try:
+        from brotli_asgi import BrotliMiddleware
+        app.add_middleware(BrotliMiddleware, quality=4, minimum_size=512)
+    except ImportError:
+        from fastapi.middleware.gzip import GZipMiddleware
+        app.add_middleware(GZipMiddleware, minimum_size=512)
 
     # Mount dashboard static files if they exist
     import os
@@ -113,7 +196,8 @@ def create_app(agent_bridge: AgentBridge):
         token = await authenticate_request(Request(scope={'type': 'http'}))
         if token:
             await app.state.security_middleware.authorize_request(token, 'read')
-        return agent_bridge.get_status()
+        # Serialize directly rather than through FastAPI's jsonable_encoder
+        return Response(content=agent_bridge.get_status_bytes(), media_type="application/json")
     
     @app.post("/connect")
     async def connect_framework(framework: str, endpoint: str, request: Request, **kwargs):
@@ -152,13 +236,12 @@ def create_app(agent_bridge: AgentBridge):
                 raise HTTPException(status_code=403, detail=f"Target framework {target} is not trusted")
             
             # Create a message object from the received data
-            from datetime import datetime
             message = Message(
                 type=MessageType[message_data.get('type', 'TASK_REQUEST').upper()],
                 source=source,
                 target=target,
                 content=message_data.get('content', {}),
-                timestamp=datetime.now().timestamp(),
+                timestamp=time.time(),
                 correlation_id=message_data.get('correlation_id'),
                 reply_to=message_data.get('reply_to'),
                 metadata=message_data.get('metadata')
@@ -174,7 +257,7 @@ def create_app(agent_bridge: AgentBridge):
     
     @app.post("/broadcast")
     async def broadcast_message(source: str, message_data: Dict[Any, Any], 
-                              target_frameworks: list = None, request: Request):
+                              request: Request, target_frameworks: list = None):
         """Broadcast a message to multiple frameworks."""
         token = await authenticate_request(request)
         if token:
@@ -186,13 +269,12 @@ def create_app(agent_bridge: AgentBridge):
                 raise HTTPException(status_code=403, detail=f"Source framework {source} is not trusted")
             
             # Create a message object from the received data
-            from datetime import datetime
             message = Message(
                 type=MessageType[message_data.get('type', 'TASK_REQUEST').upper()],
                 source=source,
                 target="all",  # Broadcast target
                 content=message_data.get('content', {}),
-                timestamp=datetime.now().timestamp(),
+                timestamp=time.time(),
                 correlation_id=message_data.get('correlation_id'),
                 reply_to=message_data.get('reply_to'),
                 metadata=message_data.get('metadata')
@@ -208,106 +290,95 @@ def create_app(agent_bridge: AgentBridge):
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
     
-    @app.websocket("/ws")
-    async def websocket_endpoint(websocket: WebSocket):
-        """WebSocket endpoint for real-time communication."""
+    async def process_ws_message(message_dict: Dict[str, Any]):
+        """Process a single WebSocket request and return the reply, if any."""
+        # Authenticate WebSocket requests if required
+        if agent_bridge.config.security.require_auth:
+            token = message_dict.get('token')
+            if token:
+                try:
+                    agent_bridge.security_manager.authenticate(token)
+                    # Authorize based on action
+                    action = message_dict.get('action', 'read')
+                    perm = 'write' if action in ['send_message', 'connect'] else 'read'
+                    agent_bridge.security_manager.authorize(token, perm)
+                except (AuthenticationError, AuthorizationError) as e:
+                    return {
+                        "type": "error",
+                        "message": str(e)
+                    }
+        
+        # Dispatch the message based on its action
+        handler = _WS_ACTIONS.get(message_dict.get('action'))
+        if handler is None:
+            return None
+        return await handler(agent_bridge, message_dict)
+    
+    async def serve_ws(websocket: WebSocket, receive, send, loads, dumps):
+        """Run a WebSocket session, decoding and encoding frames with loads/dumps.
+        
+        A frame holding an array is treated as a batch: its requests are
+        processed concurrently and answered with a single array frame whose
+        entries line up with the requests (null where there is no reply, an
+        error reply where a request failed). Batches larger than
+        MAX_WS_BATCH_SIZE are rejected with a single error reply.
+        """
         await websocket.accept()
         
         try:
             while True:
                 # Receive message from client
-                data = await websocket.receive_text()
-                message_dict = json.loads(data)
+                payload = loads(await receive())
                 
-                # Authenticate WebSocket requests if required
-                if agent_bridge.config.security.require_auth:
-                    token = message_dict.get('token')
-                    if token:
-                        try:
-                            agent_bridge.security_manager.authenticate(token)
-                            # Authorize based on action
-                            action = message_dict.get('action', 'read')
-                            perm = 'write' if action in ['send_message', 'connect'] else 'read'
-                            agent_bridge.security_manager.authorize(token, perm)
-                        except (AuthenticationError, AuthorizationError) as e:
-                            await websocket.send_text(json.dumps({
-                                "type": "error",
-                                "message": str(e)
-                            }))
-                            continue
-                
-                # Process the message based on type
-                if message_dict.get('action') == 'send_message':
-                    source = message_dict.get('source')
-                    target = message_dict.get('target')
-                    
-                    # Security check: verify if frameworks are trusted
-                    if not agent_bridge.security_manager.is_trusted_framework(source):
-                        await websocket.send_text(json.dumps({
-                            "type": "error",
-                            "message": f"Source framework {source} is not trusted"
-                        }))
-                        continue
-                        
-                    if not agent_bridge.security_manager.is_trusted_framework(target):
-                        await websocket.send_text(json.dumps({
+                if isinstance(payload, list):
+                    if len(payload) > MAX_WS_BATCH_SIZE:
+                        await send(dumps({
                             "type": "error",
-                            "message": f"Target framework {target} is not trusted"
+                            "message": f"Batch of {len(payload)} requests exceeds the limit of {MAX_WS_BATCH_SIZE}"
                         }))
                         continue
                     
-                    content = message_dict.get('content', {})
-                    
-                    # Create a message object
-                    from datetime import datetime
-                    message = Message(
-                        type=MessageType[message_dict.get('type', 'TASK_REQUEST').upper()],
-                        source=source,
-                        target=target,
-                        content=content,
-                        timestamp=datetime.now().timestamp(),
-                        correlation_id=message_dict.get('correlation_id'),
-                        reply_to=message_dict.get('reply_to'),
-                        metadata=message_dict.get('metadata')
+                    # One failing request shouldn't drop its siblings' replies
+                    results = await asyncio.gather(
+                        *(process_ws_message(message_dict) for message_dict in payload),
+                        return_exceptions=True
                     )
-                    
-                    # Send message through bridge
-                    result = await agent_bridge.send_message(source, target, message)
-                    
-                    # Send response back to client
-                    await websocket.send_text(json.dumps({
-                        "type": "response",
-                        "correlation_id": message.correlation_id,
-                        "result": result
-                    }))
+                    replies = [
+                        {"type": "error", "message": str(result)} if isinstance(result, BaseException) else result
+                        for result in results
+                    ]
+                    await send(dumps(replies))
+                    continue
                 
-                elif message_dict.get('action') == 'subscribe_status':
-                    # Security check: verify read permission
-                    if agent_bridge.config.security.require_auth:
-                        token = message_dict.get('token')
-                        if token:
-                            try:
-                                agent_bridge.security_manager.authenticate(token)
-                                agent_bridge.security_manager.authorize(token, 'read')
-                            except (AuthenticationError, AuthorizationError) as e:
-                                await websocket.send_text(json.dumps({
-                                    "type": "error",
-                                    "message": str(e)
-                                }))
-                                continue
-                    
-                    # Send current status
-                    status = agent_bridge.get_status()
-                    await websocket.send_text(json.dumps({
-                        "type": "status_update",
-                        "status": status
-                    }))
+                reply = await process_ws_message(payload)
+                if reply is not None:
+                    # Send response back to client
+                    await send(dumps(reply))
                     
         except Exception as e:
             print(f"WebSocket error: {e}")
         finally:
             await websocket.close()
     
+    @app.websocket("/ws")
+    async def websocket_endpoint(websocket: WebSocket):
+        """WebSocket endpoint for real-time communication using JSON text frames."""
+        await serve_ws(websocket, websocket.receive_text, websocket.send_text,
+                       json.loads, json.dumps)
+    
+    # Binary endpoint for bridge-internal clients, only when msgpack is installed
+    try:
+        import msgpack
+    except ImportError:
+        msgpack = None
+    
+    if msgpack is not None:
+        @app.websocket("/ws-binary")
+        async def websocket_binary_endpoint(websocket: WebSocket):
+            """WebSocket endpoint speaking the /ws protocol with msgpack binary frames."""
+            await serve_ws(websocket, websocket.receive_bytes, websocket.send_bytes,
+                           msgpack.unpackb, msgpack.packb)
+    
     @app.get("/frameworks")
     async def list_connected_frameworks(request: Request):
         """List all connected frameworks."""
@@ -7,10 +7,18 @@ import yaml
 from typing import Dict, Any, Optional
 from pathlib import Path
 import asyncio
+import dataclasses
+import functools
 import hashlib
-import uuid
+import os
+import threading
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the json module
+    orjson = None
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load configuration from YAML or JSON file."""
@@ -20,6 +28,8 @@ def load_config(config_path: str) -> Dict[str, Any]:
         with open(path, 'r') as f:
             return yaml.safe_load(f)
     elif path.suffix.lower() == '.json':
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with open(path, 'r') as f:
             return json.load(f)
     else:
@@ -34,52 +44,164 @@ def save_config(config: Dict[str, Any], config_path: str, format: str = 'yaml'):
         with open(path, 'w') as f:
             yaml.dump(config, f, default_flow_style=False)
     elif format.lower() == 'json' or path.suffix.lower() == '.json':
+        if orjson is not None:
+            try:
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # e.g. ints wider than 64 bits; the json module handles them
+            else:
+                path.write_bytes(data)
+                return
         with open(path, 'w') as f:
             json.dump(config, f, indent=2)
     else:
         raise ValueError(f"Unsupported format: {format}")
 
 
+def add_slots(cls):
+    """Recreate a dataclass with __slots__ for its fields.
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10+.
+    """
+    dataclass_fields = dataclasses.fields(cls)
+    field_names = tuple(f.name for f in dataclass_fields)
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Defaults live on __init__; class attributes would shadow the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    
+    # The generated __init__ leaves init=False fields with a plain default
+    # to the class attribute removed above, so set those here instead
+    slot_defaults = tuple(
+        (f.name, f.default) for f in dataclass_fields
+        if not f.init and f.default is not dataclasses.MISSING
+    )
+    if slot_defaults:
+        dataclass_init = cls_dict['__init__']
+        
+        @functools.wraps(dataclass_init)
+        def __init__(self, *args, **kwargs):
+            for name, default in slot_defaults:
+                object.__setattr__(self, name, default)
+            dataclass_init(self, *args, **kwargs)
+        
+        cls_dict['__init__'] = __init__
+    
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available.
+    
+    Falls back to the json module for anything orjson rejects, such as
+    integers wider than 64 bits, so both paths accept the same data.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+def dumps_json_bytes(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when available.
+    
+    Values JSON can't represent are written with str(). Like dumps_json(),
+    this falls back to the json module for anything orjson rejects.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(',', ':'), default=str).encode()
+
+
+class _UUIDPool:
+    """Hands out random (version 4) UUID strings from a pre-read entropy buffer.
+    
+    Reading entropy for many IDs at once and formatting the hex string
+    directly avoids the per-call os.urandom read and uuid.UUID object that
+    str(uuid.uuid4()) costs.
+    """
+    
+    _BATCH = 64  # UUIDs per os.urandom call
+    _VARIANT = '89ab'  # RFC 4122 variant nibbles
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Drop buffered entropy, e.g. so a forked child doesn't reuse it."""
+        self._lock = threading.Lock()
+        self._hex = ''
+        self._offset = 0
+    
+    def next(self) -> str:
+        """Return the next UUID string."""
+        with self._lock:
+            if self._offset >= len(self._hex):
+                self._hex = os.urandom(16 * self._BATCH).hex()
+                self._offset = 0
+            h = self._hex[self._offset:self._offset + 32]
+            self._offset += 32
+        return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{self._VARIANT[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+_uuid_pool = _UUIDPool()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_uuid_pool.reset)
+
+
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID for tracking messages."""
-    return str(uuid.uuid4())
+    return _uuid_pool.next()
 
 
 def calculate_checksum(data: Any) -> str:
-    """Calculate checksum of data for integrity verification."""
-    data_str = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(data_str.encode()).hexdigest()
+    """Calculate checksum of data for integrity verification.
+    
+    Returns the hex BLAKE2b-256 digest of the data's compact, key-sorted
+    JSON. Earlier releases hashed JSON with the default separators using
+    SHA-256, so checksums stored by them won't match and must be recomputed.
+    """
+    data_bytes = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode()
+    # BLAKE2b is faster than SHA-256 in software and ships with hashlib
+    return hashlib.blake2b(data_bytes, digest_size=32).hexdigest()
+
+
+# JSON schema type names mapped to the Python types that satisfy them
+_SCHEMA_TYPES = {
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+    'array': list,
+    'object': dict,
+}
 
 
 def validate_json_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
     """Basic JSON schema validation."""
     try:
         # This is a simplified validation - in practice you'd use a proper schema validator
-        required_fields = schema.get('required', [])
-        properties = schema.get('properties', {})
-        
-        for field in required_fields:
+        for field in schema.get('required', []):
             if field not in data:
                 return False
-                
-        for field, field_spec in properties.items():
-            if field in data:
-                expected_type = field_spec.get('type')
-                if expected_type == 'string' and not isinstance(data[field], str):
-                    return False
-                elif expected_type == 'integer' and not isinstance(data[field], int):
-                    return False
-                elif expected_type == 'number' and not isinstance(data[field], (int, float)):
-                    return False
-                elif expected_type == 'boolean' and not isinstance(data[field], bool):
-                    return False
-                elif expected_type == 'array' and not isinstance(data[field], list):
-                    return False
-                elif expected_type == 'object' and not isinstance(data[field], dict):
+
+        for field, field_spec in schema.get('properties', {}).items():
+            expected_type = field_spec.get('type')
+            # Only single named types are checked; unions like ["string", "null"] are skipped
+            if field in data and isinstance(expected_type, str) and expected_type in _SCHEMA_TYPES:
+                if not isinstance(data[field], _SCHEMA_TYPES[expected_type]):
                     return False
-        
+
         return True
-    except:
+    except (AttributeError, TypeError):
         return False
 
 
@@ -105,30 +227,49 @@ async def retry_with_backoff(func, retries: int = 3, backoff_factor: float = 1.0
 
 def sanitize_input(user_input: str) -> str:
     """Sanitize user input to prevent injection attacks."""
-    # Remove potentially dangerous characters/sequences
-    sanitized = user_input.replace('\0', '')  # Null bytes
-    sanitized = sanitized.replace('..', '')   # Path traversal
+    # Remove potentially dangerous characters/sequences. The membership
+    # checks are cheap scans, so clean input is returned without copying.
+    # Null bytes go first so that e.g. '.\0.' cannot survive as '..'.
+    sanitized = user_input
+    if '\0' in sanitized:
+        sanitized = sanitized.replace('\0', '')  # Null bytes
+    if '..' in sanitized:
+        sanitized = sanitized.replace('..', '')  # Path traversal
     # Add more sanitization as needed
-    
+
     return sanitized
 
 
 def merge_configs(base_config: Dict[str, Any], override_config: Dict[str, Any]) -> Dict[str, Any]:
     """Recursively merge two configuration dictionaries."""
-    result = base_config.copy()
-    
-    for key, value in override_config.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
-    
+    result = dict(base_config)
+    # Walk the override tree iteratively; only subtrees that are actually
+    # merged get copied, untouched branches are shared with the base config.
+    stack = [(result, override_config)]
+
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current = dict(current)
+                target[key] = current
+                stack.append((current, value))
+            else:
+                target[key] = value
+
     return result
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str, separator: str) -> tuple:
+    """Split a nested-value path into its keys, cached per path."""
+    return tuple(path.split(separator))
+
+
 def get_nested_value(data: Dict[str, Any], path: str, separator: str = '.') -> Any:
     """Get a value from nested dictionary using dot notation path."""
-    keys = path.split(separator)
+    keys = _split_path(path, separator)
     current = data
     
     for key in keys:
@@ -142,7 +283,7 @@ def get_nested_value(data: Dict[str, Any], path: str, separator: str = '.') -> A
 
 def set_nested_value(data: Dict[str, Any], path: str, value: Any, separator: str = '.') -> None:
     """Set a value in nested dictionary using dot notation path."""
-    keys = path.split(separator)
+    keys = _split_path(path, separator)
     current = data
     
     for key in keys[:-1]:
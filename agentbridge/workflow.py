@@ -5,12 +5,13 @@ Workflow Engine for AgentBridge - Define and execute cross-framework workflows
 import asyncio
 import json
 from enum import Enum
-from typing import Dict, Any, List, Optional, Callable, Union, TYPE_CHECKING
+from typing import Dict, Any, Iterable, List, Optional, Callable, Union, Tuple, Set, FrozenSet, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
-import uuid
+import time
 from .protocol import Message, MessageType
 from .logging import get_logger
+from .utils import add_slots, generate_correlation_id
 
 # Avoid circular import
 if TYPE_CHECKING:
@@ -36,6 +37,7 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
+@add_slots
 @dataclass
 class TaskDefinition:
     """Definition of a task in a workflow."""
@@ -48,8 +50,42 @@ class TaskDefinition:
     timeout: int = 300  # 5 minutes default
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    # Inputs split into literal values and variable references, filled in
+    # when the workflow is registered (see _compile_task_inputs)
+    _compiled_inputs: Optional[Tuple[Dict[str, Any], List[Tuple[str, Optional[str], str]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Frozen copy of dependencies for subset checks, filled in at registration
+    _dependency_set: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
+def _compile_task_inputs(inputs: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[str, Optional[str], str]]]:
+    """Split task inputs into a template dict and its variable references.
+    
+    References like ``${variable_name}`` or ``${task_id.output_name}`` are
+    returned as ``(key, task_id, name)`` tuples, with ``task_id`` set to None
+    for workflow variables. The template keeps every key in its original
+    order with the unresolved value, so literal-only inputs need no further
+    work at execution time.
+    """
+    template = dict(inputs)
+    references = []
+    
+    for key, value in inputs.items():
+        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+            var_path = value[2:-1]  # Remove ${ and }
+            if "." in var_path:
+                task_id, output_name = var_path.split(".", 1)
+                references.append((key, task_id, output_name))
+            else:
+                references.append((key, None, var_path))
+    
+    return template, references
+
+
+@add_slots
 @dataclass
 class WorkflowDefinition:
     """Definition of a complete workflow."""
@@ -61,6 +97,10 @@ class WorkflowDefinition:
     end_tasks: List[str] = field(default_factory=list)    # Tasks with no dependents
     timeout: int = 3600  # 1 hour default
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Tasks keyed by ID, filled in when the workflow is registered
+    tasks_by_id: Dict[str, TaskDefinition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -68,11 +108,23 @@ class TaskExecution:
     """Execution instance of a task."""
     task_def: TaskDefinition
     status: TaskStatus = TaskStatus.PENDING
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    started_at: Optional[float] = None    # Wall-clock start (epoch seconds)
+    completed_at: Optional[float] = None  # started_at plus the monotonic run time
     result: Optional[Any] = None
     error: Optional[str] = None
     retry_count: int = 0
+    duration_ns: Optional[int] = None     # Monotonic run time in nanoseconds
+    _start_ns: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def mark_started(self):
+        """Record when the task started running."""
+        self.started_at = time.time()
+        self._start_ns = time.monotonic_ns()
+    
+    def mark_finished(self):
+        """Record how long the task ran and when it finished."""
+        self.duration_ns = time.monotonic_ns() - self._start_ns
+        self.completed_at = self.started_at + self.duration_ns / 1e9
 
 
 @dataclass
@@ -86,6 +138,7 @@ class WorkflowExecution:
     task_executions: Dict[str, TaskExecution] = field(default_factory=dict)
     variables: Dict[str, Any] = field(default_factory=dict)  # Shared workflow variables
     error: Optional[str] = None
+    completed_task_ids: Set[str] = field(default_factory=set)  # IDs of successfully completed tasks
 
 
 class WorkflowEngine:
@@ -101,26 +154,49 @@ class WorkflowEngine:
         self.task_results: Dict[str, Dict[str, Any]] = {}  # Cache task results
     
     def register_workflow(self, workflow_def: WorkflowDefinition):
-        """Register a workflow definition."""
+        """Register a workflow definition.
+        
+        Task inputs and dependencies are precompiled here, so edits made to
+        a definition after it is registered take effect only once it is
+        registered again.
+        """
+        self._prepare_workflow(workflow_def)
         self.workflow_definitions[workflow_def.id] = workflow_def
+        self.logger.info("WorkflowEngine", "Registered workflow: %s", workflow_def.name)
+    
+    def register_workflows(self, workflow_defs: Iterable[WorkflowDefinition]):
+        """Register several workflow definitions at once, as with register_workflow()."""
+        prepared = {}
+        for workflow_def in workflow_defs:
+            self._prepare_workflow(workflow_def)
+            prepared[workflow_def.id] = workflow_def
+        self.workflow_definitions.update(prepared)
+        if prepared:
+            self.logger.info("WorkflowEngine", "Registered %d workflows: %s", len(prepared),
+                             ", ".join(workflow_def.name for workflow_def in prepared.values()))
+    
+    def _prepare_workflow(self, workflow_def: WorkflowDefinition):
+        """Index and precompute per-task data for a workflow being registered."""
+        workflow_def.tasks_by_id = {task.id: task for task in workflow_def.tasks}
+        for task in workflow_def.tasks:
+            task._dependency_set = frozenset(task.dependencies)
+            task._compiled_inputs = _compile_task_inputs(task.inputs)
         self._calculate_start_end_tasks(workflow_def)
-        self.logger.info("WorkflowEngine", f"Registered workflow: {workflow_def.name}")
     
     def _calculate_start_end_tasks(self, workflow_def: WorkflowDefinition):
         """Calculate start and end tasks for a workflow."""
-        all_task_ids = {task.id for task in workflow_def.tasks}
+        all_task_ids = workflow_def.tasks_by_id.keys() or {task.id for task in workflow_def.tasks}
         
         # Find tasks with no dependencies (start tasks)
-        start_tasks = []
-        for task in workflow_def.tasks:
-            if not task.dependencies or set(task.dependencies).isdisjoint(all_task_ids):
-                start_tasks.append(task.id)
+        start_tasks = [
+            task.id for task in workflow_def.tasks
+            if not task.dependencies or all_task_ids.isdisjoint(task.dependencies)
+        ]
         
         # Find tasks that are not depended on by any other task (end tasks)
         dependent_tasks = set()
         for task in workflow_def.tasks:
-            for dep in task.dependencies:
-                dependent_tasks.add(dep)
+            dependent_tasks.update(task.dependencies)
         
         end_tasks = [task.id for task in workflow_def.tasks if task.id not in dependent_tasks]
         
@@ -129,41 +205,36 @@ class WorkflowEngine:
     
     def _resolve_inputs(self, task_def: TaskDefinition, workflow_execution: WorkflowExecution) -> Dict[str, Any]:
         """Resolve task inputs using workflow variables and previous task results."""
-        resolved_inputs = {}
+        if task_def._compiled_inputs is None:
+            task_def._compiled_inputs = _compile_task_inputs(task_def.inputs)
+        template, references = task_def._compiled_inputs
         
-        for key, value in task_def.inputs.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                # This is a variable reference like ${variable_name} or ${task_id.output_name}
-                var_path = value[2:-1]  # Remove ${ and }
-                
-                if "." in var_path:
-                    # Task output reference: task_id.output_name
-                    task_id, output_name = var_path.split(".", 1)
-                    if task_id in workflow_execution.task_executions:
-                        task_exec = workflow_execution.task_executions[task_id]
-                        if task_exec.status == TaskStatus.COMPLETED and task_exec.result:
-                            if isinstance(task_exec.result, dict) and output_name in task_exec.result:
-                                resolved_inputs[key] = task_exec.result[output_name]
-                            else:
-                                resolved_inputs[key] = task_exec.result
+        # Always a fresh dict: it ends up in the message handed to the adapter
+        resolved_inputs = dict(template)
+        
+        for key, task_id, name in references:
+            if task_id is not None:
+                # Task output reference: task_id.output_name
+                if task_id in workflow_execution.task_executions:
+                    task_exec = workflow_execution.task_executions[task_id]
+                    if task_exec.status == TaskStatus.COMPLETED and task_exec.result:
+                        if isinstance(task_exec.result, dict) and name in task_exec.result:
+                            resolved_inputs[key] = task_exec.result[name]
                         else:
-                            resolved_inputs[key] = value  # Keep unresolved if task not completed
+                            resolved_inputs[key] = task_exec.result
+                    # Otherwise keep unresolved if task not completed
                 else:
-                    # Workflow variable reference
-                    if var_path in workflow_execution.variables:
-                        resolved_inputs[key] = workflow_execution.variables[var_path]
-                    else:
-                        resolved_inputs[key] = value  # Keep unresolved if variable not found
-            else:
-                # Literal value
-                resolved_inputs[key] = value
+                    del resolved_inputs[key]  # Task hasn't started yet
+            elif name in workflow_execution.variables:
+                # Workflow variable reference; kept unresolved if not found
+                resolved_inputs[key] = workflow_execution.variables[name]
         
         return resolved_inputs
     
     async def _execute_task(self, task_def: TaskDefinition, workflow_execution: WorkflowExecution) -> Any:
         """Execute a single task."""
         task_exec = TaskExecution(task_def=task_def)
-        task_exec.started_at = datetime.now()
+        task_exec.mark_started()
         task_exec.status = TaskStatus.RUNNING
         
         # Store task execution in workflow
@@ -183,7 +254,7 @@ class WorkflowEngine:
                     "inputs": resolved_inputs,
                     "task_id": task_def.id
                 },
-                timestamp=task_exec.started_at.timestamp()
+                timestamp=task_exec.started_at
             )
             
             # Execute the task via the bridge
@@ -191,7 +262,8 @@ class WorkflowEngine:
             
             task_exec.result = result
             task_exec.status = TaskStatus.COMPLETED
-            task_exec.completed_at = datetime.now()
+            task_exec.mark_finished()
+            workflow_execution.completed_task_ids.add(task_def.id)
             
             # Update workflow variables if this task has outputs
             if task_def.outputs and isinstance(result, dict):
@@ -199,40 +271,44 @@ class WorkflowEngine:
                     if output_name in result:
                         workflow_execution.variables[f"{task_def.id}.{output_name}"] = result[output_name]
             
-            self.logger.info("WorkflowEngine", f"Task {task_def.id} completed successfully")
+            self.logger.info("WorkflowEngine", "Task %s completed successfully", task_def.id)
             return result
             
+        except asyncio.CancelledError:
+            task_exec.error = "Task cancelled"
+            task_exec.status = TaskStatus.FAILED
+            task_exec.mark_finished()
+            raise
         except Exception as e:
             task_exec.error = str(e)
             task_exec.status = TaskStatus.FAILED
-            task_exec.completed_at = datetime.now()
+            task_exec.mark_finished()
             
-            self.logger.error("WorkflowEngine", f"Task {task_def.id} failed: {str(e)}")
+            self.logger.error("WorkflowEngine", "Task %s failed: %s", task_def.id, e)
             raise
     
+    @staticmethod
+    def _dependencies_completed(task_def: TaskDefinition, completed: Set[str]) -> bool:
+        """Check a task's dependencies against a set of completed task IDs."""
+        dependencies = task_def._dependency_set
+        if dependencies is None:
+            # Not registered through register_workflow()
+            dependencies = frozenset(task_def.dependencies)
+        return dependencies <= completed
+    
     async def _check_dependencies_met(self, task_def: TaskDefinition, workflow_execution: WorkflowExecution) -> bool:
         """Check if all dependencies for a task are met."""
-        for dep_task_id in task_def.dependencies:
-            if dep_task_id not in workflow_execution.task_executions:
-                return False  # Dependency task hasn't started
-            
-            dep_task_exec = workflow_execution.task_executions[dep_task_id]
-            if dep_task_exec.status != TaskStatus.COMPLETED:
-                return False  # Dependency task hasn't completed
-        
-        return True
+        return self._dependencies_completed(task_def, workflow_execution.completed_task_ids)
     
     async def _get_ready_tasks(self, workflow_execution: WorkflowExecution) -> List[TaskDefinition]:
         """Get tasks that are ready to run (dependencies satisfied)."""
-        ready_tasks = []
+        started = workflow_execution.task_executions
+        completed = workflow_execution.completed_task_ids
         
-        for task_def in workflow_execution.workflow_def.tasks:
-            if task_def.id not in workflow_execution.task_executions:
-                # Task hasn't started yet
-                if await self._check_dependencies_met(task_def, workflow_execution):
-                    ready_tasks.append(task_def)
-        
-        return ready_tasks
+        return [
+            task_def for task_def in workflow_execution.workflow_def.tasks
+            if task_def.id not in started and self._dependencies_completed(task_def, completed)
+        ]
     
     async def execute_workflow(self, workflow_id: str, input_variables: Optional[Dict[str, Any]] = None) -> str:
         """Execute a workflow asynchronously."""
@@ -242,7 +318,7 @@ class WorkflowEngine:
         workflow_def = self.workflow_definitions[workflow_id]
         
         # Create execution instance
-        execution_id = str(uuid.uuid4())
+        execution_id = generate_correlation_id()
         workflow_execution = WorkflowExecution(
             workflow_def=workflow_def,
             id=execution_id,
@@ -254,15 +330,22 @@ class WorkflowEngine:
         # Store execution
         self.active_executions[execution_id] = workflow_execution
         
-        self.logger.info("WorkflowEngine", f"Started workflow execution: {execution_id} for workflow: {workflow_def.name}")
+        self.logger.info("WorkflowEngine", "Started workflow execution: %s for workflow: %s", execution_id, workflow_def.name)
+        
+        running: Dict[asyncio.Task, str] = {}  # In-flight task -> task id
         
         try:
             # Execute workflow until completion
             while workflow_execution.status == WorkflowStatus.RUNNING:
-                # Get tasks that are ready to run
-                ready_tasks = await self._get_ready_tasks(workflow_execution)
+                # Start every task whose dependencies are satisfied as soon as
+                # they are, rather than waiting for a whole wave to finish
+                in_flight = set(running.values())
+                for task_def in await self._get_ready_tasks(workflow_execution):
+                    if task_def.id not in in_flight:
+                        task = asyncio.ensure_future(self._execute_task(task_def, workflow_execution))
+                        running[task] = task_def.id
                 
-                if not ready_tasks:
+                if not running:
                     # Check if workflow is complete
                     completed_tasks = [
                         task_exec for task_exec in workflow_execution.task_executions.values()
@@ -279,31 +362,29 @@ class WorkflowEngine:
                         await asyncio.sleep(0.1)
                         continue
                 
-                # Execute ready tasks concurrently
-                tasks_to_run = []
-                for task_def in ready_tasks:
-                    tasks_to_run.append(self._execute_task(task_def, workflow_execution))
-                
-                # Run tasks concurrently
-                results = await asyncio.gather(*tasks_to_run, return_exceptions=True)
+                # Wake up on the first task to finish
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
                 
                 # Check for failures
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        # Mark workflow as failed
-                        workflow_execution.status = WorkflowStatus.FAILED
-                        workflow_execution.error = str(result)
-                        workflow_execution.completed_at = datetime.now()
-                        
-                        self.logger.error("WorkflowEngine", f"Workflow {execution_id} failed: {str(result)}")
-                        break
-                else:
-                    # If no failures, continue the loop
-                    continue
-                
-                break  # Break if workflow failed
+                for task in done:
+                    del running[task]
+                    # exception() raises CancelledError on a cancelled task
+                    if task.cancelled():
+                        error = "Task cancelled"
+                    elif task.exception() is not None:
+                        error = str(task.exception())
+                    else:
+                        continue
+                    
+                    # Mark workflow as failed; siblings are cancelled below
+                    workflow_execution.status = WorkflowStatus.FAILED
+                    workflow_execution.error = error
+                    workflow_execution.completed_at = datetime.now()
+                    
+                    self.logger.error("WorkflowEngine", "Workflow %s failed: %s", execution_id, error)
+                    break
             
-            self.logger.info("WorkflowEngine", f"Workflow execution {execution_id} finished with status: {workflow_execution.status.value}")
+            self.logger.info("WorkflowEngine", "Workflow execution %s finished with status: %s", execution_id, workflow_execution.status.value)
             return execution_id
             
         except Exception as e:
@@ -311,9 +392,15 @@ class WorkflowEngine:
             workflow_execution.error = str(e)
             workflow_execution.completed_at = datetime.now()
             
-            self.logger.error("WorkflowEngine", f"Workflow execution {execution_id} failed with exception: {str(e)}")
+            self.logger.error("WorkflowEngine", "Workflow execution %s failed with exception: %s", execution_id, e)
             raise
         finally:
+            # Don't leave tasks of a finished or failed workflow running
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            
             # Cleanup if workflow completed
             if workflow_execution.status in [WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED]:
                 del self.active_executions[execution_id]
@@ -330,7 +417,7 @@ class WorkflowEngine:
         # Remove from active executions
         del self.active_executions[execution_id]
         
-        self.logger.info("WorkflowEngine", f"Cancelled workflow execution: {execution_id}")
+        self.logger.info("WorkflowEngine", "Cancelled workflow execution: %s", execution_id)
     
     def get_workflow_status(self, execution_id: str) -> Optional[WorkflowExecution]:
         """Get the status of a workflow execution."""
@@ -386,6 +473,12 @@ class WorkflowBuilder:
         self.tasks.append(task)
         return self
     
+    def add_tasks(self, specs: Iterable[Dict[str, Any]]) -> 'WorkflowBuilder':
+        """Add several tasks, each given as a dict of add_task() arguments."""
+        for spec in specs:
+            self.add_task(**spec)
+        return self
+    
     def build(self, workflow_id: str, name: str, description: str = "") -> WorkflowDefinition:
         """Build the workflow definition."""
         workflow_def = WorkflowDefinition(
@@ -5,6 +5,7 @@ Example demonstrating AgentBridge's intelligent features and extended adapters
 
 import asyncio
 import json
+import sys
 from datetime import datetime
 
 from agentbridge import AgentBridge, get_intelligence_components, get_extended_adapter_components
@@ -12,6 +13,17 @@ from agentbridge.protocol import Message, MessageType
 from agentbridge.intelligence import OptimizationStrategy
 
 
+# Summary shown at the end of the demo
+KEY_FEATURES = (
+    "AI-driven optimization strategies",
+    "Performance prediction and learning",
+    "Adaptive resource allocation",
+    "Extended ecosystem adapters",
+    "Intelligent workflow execution",
+    "Predictive analytics for task routing",
+)
+
+
 async def demonstrate_intelligent_routing():
     """Demonstrate intelligent task routing based on performance predictions"""
     print("🚀 Demonstrating Intelligent Routing")
@@ -28,14 +40,16 @@ async def demonstrate_intelligent_routing():
     print("📋 Available frameworks: ['crewai', 'langgraph', 'autogen']")
     
     # Simulate recording some performance data for learning
-    await bridge.intelligence_manager.record_task_outcome(
-        "crewai", "data_analysis", 2.5, True, 0.02
-    )
-    await bridge.intelligence_manager.record_task_outcome(
-        "langgraph", "data_analysis", 3.2, True, 0.015
-    )
-    await bridge.intelligence_manager.record_task_outcome(
-        "autogen", "data_analysis", 1.8, True, 0.03
+    await asyncio.gather(
+        bridge.intelligence_manager.record_task_outcome(
+            "crewai", "data_analysis", 2.5, True, 0.02
+        ),
+        bridge.intelligence_manager.record_task_outcome(
+            "langgraph", "data_analysis", 3.2, True, 0.015
+        ),
+        bridge.intelligence_manager.record_task_outcome(
+            "autogen", "data_analysis", 1.8, True, 0.03
+        )
     )
     
     # Now test intelligent routing
@@ -51,10 +65,10 @@ async def demonstrate_intelligent_routing():
         OptimizationStrategy.LOAD_BALANCED
     ]
     
-    for strategy in strategies:
-        optimal_framework = await bridge.intelligence_manager.optimize_task_execution(
-            task_description, available_frameworks
-        )
+    picks = await bridge.intelligence_manager.optimize_task_execution_multi(
+        task_description, available_frameworks, strategies
+    )
+    for strategy, optimal_framework in picks.items():
         print(f"   {strategy.value}: {optimal_framework}")
     
     print("\n✅ Intelligent routing demonstration complete")
@@ -123,14 +137,16 @@ async def demonstrate_intelligent_workflow():
     print("🔌 Simulating framework connections...")
     
     # Record some performance data to enable learning
-    await bridge.intelligence_manager.record_task_outcome(
-        "crewai", "report_generation", 5.0, True, 0.05
-    )
-    await bridge.intelligence_manager.record_task_outcome(
-        "langgraph", "report_generation", 4.2, True, 0.04
-    )
-    await bridge.intelligence_manager.record_task_outcome(
-        "autogen", "report_generation", 6.1, True, 0.06
+    await asyncio.gather(
+        bridge.intelligence_manager.record_task_outcome(
+            "crewai", "report_generation", 5.0, True, 0.05
+        ),
+        bridge.intelligence_manager.record_task_outcome(
+            "langgraph", "report_generation", 4.2, True, 0.04
+        ),
+        bridge.intelligence_manager.record_task_outcome(
+            "autogen", "report_generation", 6.1, True, 0.06
+        )
     )
     
     # Execute intelligent workflow
@@ -171,14 +187,9 @@ async def main():
     await demonstrate_extended_adapters()
     await demonstrate_intelligent_workflow()
     
-    print("\n🎯 All demonstrations completed!")
-    print("\n💡 Key Intelligent Features:")
-    print("   • AI-driven optimization strategies")
-    print("   • Performance prediction and learning")
-    print("   • Adaptive resource allocation")
-    print("   • Extended ecosystem adapters")
-    print("   • Intelligent workflow execution")
-    print("   • Predictive analytics for task routing")
+    lines = ["\n🎯 All demonstrations completed!", "\n💡 Key Intelligent Features:"]
+    lines.extend(f"   • {feature}" for feature in KEY_FEATURES)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
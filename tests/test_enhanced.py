@@ -2,9 +2,7 @@
 Enhanced tests for AgentBridge with new features
 """
 
-import asyncio
-import sys
-sys.path.insert(0, '.')
+import pytest
 
 from agentbridge import AgentBridge, get_logger, get_metrics_collector
 from agentbridge.protocol import Message, MessageType
@@ -12,6 +10,11 @@ from agentbridge.adapter import AdapterRegistry
 from agentbridge.config import BridgeConfig, ConfigManager
 
 
+# Methods the global logger and metrics collector must provide
+LOGGER_METHODS = frozenset({'debug', 'info', 'warning', 'error', 'critical', 'exception'})
+METRICS_METHODS = frozenset({'increment_counter', 'record_timer', 'get_metrics'})
+
+
 def test_config_management():
     """Test configuration management functionality."""
     # Test creating a config
@@ -30,18 +33,58 @@ def test_config_management():
     print("✓ test_config_management passed")
 
 
+def test_save_config_json_round_trip():
+    """Test saving and loading a JSON config, including values orjson rejects."""
+    import tempfile
+    from pathlib import Path
+    from agentbridge.utils import load_config, save_config
+    
+    config = {"version": "1.0", "limits": {"max_tokens": 2 ** 70}, "ports": {8080: "main"}}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = str(Path(tmpdir) / "config.json")
+        save_config(config, config_path, format='json')
+        loaded = load_config(config_path)
+    
+    assert loaded == {"version": "1.0", "limits": {"max_tokens": 2 ** 70}, "ports": {"8080": "main"}}
+    
+    print("✓ test_save_config_json_round_trip passed")
+
+
+def test_config_framework_lookup_after_direct_edits():
+    """Test framework lookup after frameworks is edited without add_framework."""
+    from agentbridge.config import FrameworkConfig
+    
+    config = BridgeConfig()
+    config.add_framework("a", "http://localhost:8000")
+    config.add_framework("c", "http://localhost:8001")
+    assert config.get_framework("a").endpoint == "http://localhost:8000"
+    
+    # Renamed in place
+    config.frameworks[0].name = "b"
+    assert config.get_framework("a") is None
+    assert config.get_framework("b") is config.frameworks[0]
+    
+    # Replaced by index
+    config.frameworks[1] = FrameworkConfig(name="d", endpoint="http://localhost:8002")
+    assert config.get_framework("c") is None
+    assert config.get_framework("d") is config.frameworks[1]
+    
+    # Whole list replaced
+    config.frameworks = [FrameworkConfig(name="e", endpoint="http://localhost:8003")]
+    assert config.get_framework("b") is None
+    assert config.get_framework("e") is config.frameworks[0]
+    
+    print("✓ test_config_framework_lookup_after_direct_edits passed")
+
+
 def test_logging_functionality():
     """Test logging functionality."""
     logger = get_logger()
     assert logger is not None
     
     # Test that logger has expected methods
-    assert hasattr(logger, 'debug')
-    assert hasattr(logger, 'info')
-    assert hasattr(logger, 'warning')
-    assert hasattr(logger, 'error')
-    assert hasattr(logger, 'critical')
-    assert hasattr(logger, 'exception')
+    missing = LOGGER_METHODS - set(dir(logger))
+    assert not missing, f"missing logger methods: {missing}"
     
     # Test logging a message
     logger.info("TestSource", "Test message")
@@ -49,15 +92,71 @@ def test_logging_functionality():
     print("✓ test_logging_functionality passed")
 
 
+def test_logging_deferred_formatting():
+    """Test %-style arguments and details on log calls."""
+    from agentbridge.logging import AgentBridgeLogger, LogLevel
+    
+    entries = []
+    
+    class ListHandler:
+        def handle(self, log_entry):
+            entries.append(log_entry)
+    
+    logger = AgentBridgeLogger(name="DeferredFormattingTest", level=LogLevel.INFO)
+    logger.handlers.append(ListHandler())
+    
+    # Arguments are formatted into the message, a trailing dict is the details
+    logger.info("TestSource", "Processed %d items from %s", 3, "queue", {"batch": 1})
+    assert entries[-1].message == "Processed 3 items from queue"
+    assert entries[-1].details == {"batch": 1}
+    
+    # Existing call style keeps working
+    logger.info("TestSource", "Plain message", {"key": "value"})
+    assert entries[-1].message == "Plain message"
+    assert entries[-1].details == {"key": "value"}
+    
+    # Filtered out messages are never formatted
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("should not be formatted")
+    
+    logger.debug("TestSource", "Value: %s", Unformattable())
+    assert len(entries) == 2
+    
+    print("✓ test_logging_deferred_formatting passed")
+
+
+def test_file_log_handler_survives_unserializable_details():
+    """Test that a bad details value doesn't stop later entries being written."""
+    import json
+    import tempfile
+    from pathlib import Path
+    from agentbridge.logging import AgentBridgeLogger, FileLogHandler, LogLevel
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_path = Path(tmpdir) / "bridge.log"
+        handler = FileLogHandler(str(log_path))
+        logger = AgentBridgeLogger(name="FileHandlerTest", level=LogLevel.INFO)
+        logger.handlers = [handler]
+        
+        logger.info("TestSource", "bad", {"obj": object()})
+        logger.info("TestSource", "good")
+        handler.close()
+        
+        messages = [json.loads(line)["message"] for line in log_path.read_text().splitlines()]
+        assert messages == ["bad", "good"]
+    
+    print("✓ test_file_log_handler_survives_unserializable_details passed")
+
+
 def test_metrics_collection():
     """Test metrics collection functionality."""
     metrics = get_metrics_collector()
     assert metrics is not None
     
     # Test that metrics collector has expected methods
-    assert hasattr(metrics, 'increment_counter')
-    assert hasattr(metrics, 'record_timer')
-    assert hasattr(metrics, 'get_metrics')
+    missing = METRICS_METHODS - set(dir(metrics))
+    assert not missing, f"missing metrics methods: {missing}"
     
     # Test incrementing a counter
     initial_count = metrics.counters['messages_sent']
@@ -76,6 +175,89 @@ def test_metrics_collection():
     print("✓ test_metrics_collection passed")
 
 
+def test_metrics_timer_window():
+    """Test that timers keep only the most recent samples."""
+    from agentbridge.logging import MetricsCollector
+    
+    metrics = MetricsCollector(timer_window=4)
+    for value in range(1, 11):
+        metrics.record_timer('latency', value)
+    metrics.record_timer_batch('latency', [11, 12, 13])
+    
+    assert metrics.timers['latency'] == [10.0, 11.0, 12.0, 13.0]
+    timer_stats = metrics.get_metrics()['timers']['latency']
+    assert timer_stats['count'] == 4
+    assert timer_stats['min'] == 10.0
+    assert timer_stats['max'] == 13.0
+    
+    print("✓ test_metrics_timer_window passed")
+
+
+def test_metrics_timer_skips_non_finite_values():
+    """Test that NaN and infinite timer values are skipped rather than raising."""
+    from agentbridge.logging import MetricsCollector
+    
+    metrics = MetricsCollector()
+    metrics.record_timer('latency', float('nan'))
+    metrics.record_timer('latency', float('inf'))
+    metrics.record_timer('latency', 0.25)
+    metrics.record_timer_batch('latency', [float('-inf'), 0.5, float('nan')])
+    
+    assert metrics.timers['latency'] == [0.25, 0.5]
+    
+    print("✓ test_metrics_timer_skips_non_finite_values passed")
+
+
+def test_metrics_reset_and_assignment():
+    """Test replacing and resetting counters and timers."""
+    import threading
+    from agentbridge.logging import MetricsCollector
+    
+    metrics = MetricsCollector(timer_window=2)
+    metrics.increment_counter('messages_sent', 5)
+    worker = threading.Thread(target=metrics.increment_counter, args=('messages_sent', 3))
+    worker.start()
+    worker.join()
+    assert metrics.counters['messages_sent'] == 8
+    
+    # Assignment replaces the totals recorded by every thread
+    metrics.counters = {'messages_sent': 1}
+    assert metrics.counters['messages_sent'] == 1
+    metrics.timers = {'latency': [0.1, 0.2, 0.3]}
+    assert metrics.timers['latency'] == [0.2, 0.3]
+    
+    metrics.update_framework_stats('crewai', 'send')
+    metrics.reset()
+    all_metrics = metrics.get_metrics()
+    assert all_metrics['counters']['messages_sent'] == 0
+    assert 'latency' not in all_metrics['timers']
+    assert all_metrics['framework_stats'] == {}
+    
+    print("✓ test_metrics_reset_and_assignment passed")
+
+
+def test_metrics_snapshot_is_not_shared():
+    """Test that mutating a returned snapshot doesn't affect later ones."""
+    from agentbridge.logging import MetricsCollector
+    
+    metrics = MetricsCollector()
+    metrics.increment_counter('messages_sent')
+    metrics.record_timer('avg_response_time', 0.5)
+    metrics.update_framework_stats('crewai', 'send')
+    
+    first = metrics.get_metrics()
+    first['counters']['messages_sent'] = 100
+    first['timers']['avg_response_time']['count'] = 100
+    first['framework_stats']['crewai']['operations'] = 100
+    
+    second = metrics.get_metrics()
+    assert second['counters']['messages_sent'] == 1
+    assert second['timers']['avg_response_time']['count'] == 1
+    assert second['framework_stats']['crewai']['operations'] == 1
+    
+    print("✓ test_metrics_snapshot_is_not_shared passed")
+
+
 def test_bridge_with_enhanced_features():
     """Test bridge with enhanced features."""
     bridge = AgentBridge()
@@ -102,11 +284,8 @@ def test_error_handling_in_connect():
     bridge = AgentBridge()
     
     # Attempt to connect to non-existent framework
-    try:
+    with pytest.raises(ValueError):
         bridge.connect_framework("nonexistent_framework", "http://localhost:8000")
-        assert False, "Expected ValueError was not raised"
-    except ValueError:
-        pass  # Expected
     
     print("✓ test_error_handling_in_connect passed")
 
@@ -144,8 +323,12 @@ async def test_enhanced_send_message():
     )
     
     # Test that connecting framework adds to config
-    bridge.config.add_framework("test_source", "http://localhost:8000")
-    bridge.config.add_framework("mock_framework", "http://localhost:8000")
+    bridge.config.add_frameworks([
+        {"name": "test_source", "endpoint": "http://localhost:8000"},
+        {"name": "mock_framework", "endpoint": "http://localhost:8000"},
+    ])
+    assert bridge.config.get_framework("test_source").endpoint == "http://localhost:8000"
+    assert bridge.config.get_framework("mock_framework") is bridge.config.frameworks[-1]
     
     # The send_message would fail because the mock adapter doesn't have protocol_version attribute
     # But we can still test the error handling part
@@ -153,12 +336,22 @@ async def test_enhanced_send_message():
 
 
 if __name__ == "__main__":
+    import asyncio
+    
     print("Running enhanced AgentBridge tests...")
     
     # Run synchronous tests
     test_config_management()
+    test_save_config_json_round_trip()
+    test_config_framework_lookup_after_direct_edits()
     test_logging_functionality()
+    test_logging_deferred_formatting()
+    test_file_log_handler_survives_unserializable_details()
     test_metrics_collection()
+    test_metrics_timer_window()
+    test_metrics_timer_skips_non_finite_values()
+    test_metrics_reset_and_assignment()
+    test_metrics_snapshot_is_not_shared()
     test_bridge_with_enhanced_features()
     test_error_handling_in_connect()
     
@@ -2,12 +2,73 @@
 Model management tests for AgentBridge
 """
 
-import asyncio
-import sys
-sys.path.insert(0, '.')
-
 from agentbridge import AgentBridge, get_model_components
-from agentbridge.models import ModelCapability, ModelProvider
+from agentbridge.models import ModelCapability, ModelProvider, ModelRouter, ModelSpec
+
+
+# Sample models shared by the tests below, keyed by model ID. The model
+# manager and router only read registered specs, so they are not copied.
+SAMPLE_MODELS = {
+    spec.id: spec for spec in (
+        ModelSpec(
+            id="gpt-4-sample",
+            name="GPT-4 Sample Model",
+            provider=ModelProvider.OPENAI,
+            capabilities=[
+                ModelCapability.TEXT_GENERATION,
+                ModelCapability.TOOLS
+            ],
+            max_tokens=8192,
+            context_window=8192,
+            pricing={"input": 0.03, "output": 0.06},
+            endpoint="https://api.openai.com/v1/chat/completions",
+            metadata={"version": "4-turbo"}
+        ),
+        ModelSpec(
+            id="model-with-tools",
+            name="Model with Tools",
+            provider=ModelProvider.OPENAI,
+            capabilities=[
+                ModelCapability.TEXT_GENERATION,
+                ModelCapability.TOOLS
+            ],
+            max_tokens=4096,
+            context_window=4096,
+            pricing={"input": 0.01, "output": 0.03},
+            endpoint="https://api.example.com/v1/chat"
+        ),
+        ModelSpec(
+            id="model-text-only",
+            name="Text Only Model",
+            provider=ModelProvider.ANTHROPIC,
+            capabilities=[ModelCapability.TEXT_GENERATION],
+            max_tokens=8192,
+            context_window=8192,
+            pricing={"input": 0.03, "output": 0.15},
+            endpoint="https://api.anthropic.com/v1/messages"
+        ),
+        ModelSpec(
+            id="test-text-model",
+            name="Test Text Model",
+            provider=ModelProvider.OPENAI,
+            capabilities=[ModelCapability.TEXT_GENERATION],
+            max_tokens=4096,
+            context_window=4096,
+            pricing={"input": 0.01, "output": 0.03},
+            endpoint="https://api.example.com/v1/chat"
+        ),
+        ModelSpec(
+            id="stats-test-model",
+            name="Stats Test Model",
+            provider=ModelProvider.GOOGLE,
+            capabilities=[ModelCapability.TEXT_GENERATION],
+            max_tokens=2048,
+            context_window=2048,
+            pricing={"input": 0.02, "output": 0.05},
+            endpoint="https://api.google.com/v1/generate"
+        ),
+    )
+}
 
 
 def test_model_manager_initialization():
@@ -26,24 +87,7 @@ def test_register_and_discover_models():
     model_manager = bridge.model_manager
     
     # Register a sample model
-    from agentbridge.models import ModelSpec
-    
-    sample_model = ModelSpec(
-        id="gpt-4-sample",
-        name="GPT-4 Sample Model",
-        provider=ModelProvider.OPENAI,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.TOOLS
-        ],
-        max_tokens=8192,
-        context_window=8192,
-        pricing={"input": 0.03, "output": 0.06},
-        endpoint="https://api.openai.com/v1/chat/completions",
-        metadata={"version": "4-turbo"}
-    )
-    
-    model_manager.register_model(sample_model)
+    model_manager.register_model(SAMPLE_MODELS["gpt-4-sample"])
     
     # Verify model is registered
     available_models = model_manager.get_available_models()
@@ -62,38 +106,11 @@ def test_register_and_discover_models():
 
 def test_model_routing():
     """Test model routing based on capabilities."""
-    from agentbridge.models import ModelSpec, ModelRouter
-    
     router = ModelRouter()
     
     # Register two models with different capabilities
-    model1 = ModelSpec(
-        id="model-with-tools",
-        name="Model with Tools",
-        provider=ModelProvider.OPENAI,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.TOOLS
-        ],
-        max_tokens=4096,
-        context_window=4096,
-        pricing={"input": 0.01, "output": 0.03},
-        endpoint="https://api.example.com/v1/chat"
-    )
-    
-    model2 = ModelSpec(
-        id="model-text-only",
-        name="Text Only Model",
-        provider=ModelProvider.ANTHROPIC,
-        capabilities=[ModelCapability.TEXT_GENERATION],
-        max_tokens=8192,
-        context_window=8192,
-        pricing={"input": 0.03, "output": 0.15},
-        endpoint="https://api.anthropic.com/v1/messages"
-    )
-    
-    router.register_model(model1)
-    router.register_model(model2)
+    router.register_model(SAMPLE_MODELS["model-with-tools"])
+    router.register_model(SAMPLE_MODELS["model-text-only"])
     
     # Test finding models by capability
     text_models = router.find_models_by_capability(ModelCapability.TEXT_GENERATION)
@@ -116,20 +133,7 @@ async def test_route_task_to_model():
     bridge = AgentBridge()
     
     # Register a model that supports text generation
-    from agentbridge.models import ModelSpec
-    
-    text_model = ModelSpec(
-        id="test-text-model",
-        name="Test Text Model",
-        provider=ModelProvider.OPENAI,
-        capabilities=[ModelCapability.TEXT_GENERATION],
-        max_tokens=4096,
-        context_window=4096,
-        pricing={"input": 0.01, "output": 0.03},
-        endpoint="https://api.example.com/v1/chat"
-    )
-    
-    bridge.model_manager.register_model(text_model)
+    bridge.model_manager.register_model(SAMPLE_MODELS["test-text-model"])
     
     # Route a task requiring text generation
     result = await bridge.model_manager.route_task_to_model(
@@ -148,20 +152,7 @@ def test_usage_statistics():
     bridge = AgentBridge()
     
     # Register a model
-    from agentbridge.models import ModelSpec
-    
-    sample_model = ModelSpec(
-        id="stats-test-model",
-        name="Stats Test Model",
-        provider=ModelProvider.GOOGLE,
-        capabilities=[ModelCapability.TEXT_GENERATION],
-        max_tokens=2048,
-        context_window=2048,
-        pricing={"input": 0.02, "output": 0.05},
-        endpoint="https://api.google.com/v1/generate"
-    )
-    
-    bridge.model_manager.register_model(sample_model)
+    bridge.model_manager.register_model(SAMPLE_MODELS["stats-test-model"])
     
     # Get initial stats
     stats = bridge.model_manager.get_usage_statistics_sync()
@@ -173,6 +164,8 @@ def test_usage_statistics():
 
 
 if __name__ == "__main__":
+    import asyncio
+    
     print("Running model management tests...")
     
     test_model_manager_initialization()
@@ -2,9 +2,7 @@
 Security tests for AgentBridge
 """
 
-import asyncio
-import sys
-sys.path.insert(0, '.')
+import pytest
 
 from agentbridge import (
     AgentBridge, 
@@ -49,6 +47,24 @@ def test_token_generation():
     print("✓ test_token_generation passed")
 
 
+def test_bulk_token_generation():
+    """Test generating several tokens at once."""
+    config = BridgeConfig()
+    config.security.require_auth = True
+    security_manager = SecurityManager(config)
+    
+    tokens = security_manager.generate_tokens(5, ['read'], expires_in_hours=1)
+    
+    assert len(tokens) == 5
+    assert len(set(tokens)) == 5  # All tokens are distinct
+    for token in tokens:
+        assert len(token) == 43  # Same length as secrets.token_urlsafe(32)
+        assert security_manager.authenticate(token) is True
+        assert security_manager.tokens[token]['permissions'] == {'read'}
+    
+    print("✓ test_bulk_token_generation passed")
+
+
 def test_authentication():
     """Test authentication functionality."""
     config = BridgeConfig()
@@ -63,11 +79,8 @@ def test_authentication():
     assert result is True
     
     # Authenticate with invalid token
-    try:
+    with pytest.raises(AuthenticationError):
         security_manager.authenticate("invalid_token")
-        assert False, "Should have raised AuthenticationError"
-    except AuthenticationError:
-        pass  # Expected
     
     print("✓ test_authentication passed")
 
@@ -85,11 +98,8 @@ def test_authorization():
     assert result is True
     
     # Authorize with invalid permission
-    try:
+    with pytest.raises(AuthorizationError):
         security_manager.authorize(token, 'write')  # Not in token's permissions
-        assert False, "Should have raised AuthorizationError"
-    except AuthorizationError:
-        pass  # Expected
     
     print("✓ test_authorization passed")
 
@@ -136,6 +146,32 @@ def test_trusted_frameworks():
     print("✓ test_trusted_frameworks passed")
 
 
+def test_trusted_frameworks_in_place_edit():
+    """Test that trusted list changes take effect once the lookup sets are refreshed."""
+    config = BridgeConfig()
+    config.security.trusted_frameworks_only = True
+    config.security.allowed_frameworks = ["revoked", "kept"]
+    
+    security_manager = SecurityManager(config)
+    assert security_manager.is_trusted_framework("revoked") is True
+    
+    # Replacing the list is picked up without a refresh
+    config.security.allowed_frameworks = ["kept"]
+    assert security_manager.is_trusted_framework("revoked") is False
+    
+    # In-place edits need an explicit refresh
+    config.security.allowed_frameworks.append("other")
+    security_manager.refresh_lookup_sets()
+    assert security_manager.is_trusted_framework("other") is True
+    
+    config.security.allowed_origins[:] = ["https://example.com"]
+    security_manager.refresh_lookup_sets()
+    assert security_manager.validate_origin("https://example.com") is True
+    assert security_manager.validate_origin("https://evil.example") is False
+    
+    print("✓ test_trusted_frameworks_in_place_edit passed")
+
+
 def test_bridge_security_integration():
     """Test that bridge integrates security properly."""
     config = BridgeConfig()
@@ -160,10 +196,12 @@ if __name__ == "__main__":
     
     test_security_manager_initialization()
     test_token_generation()
+    test_bulk_token_generation()
     test_authentication()
     test_authorization()
     test_encryption()
     test_trusted_frameworks()
+    test_trusted_frameworks_in_place_edit()
     test_bridge_security_integration()
     
     print("\n✓ All security tests passed successfully!")
\ No newline at end of file
@@ -2,10 +2,6 @@
 Workflow tests for AgentBridge
 """
 
-import asyncio
-import sys
-sys.path.insert(0, '.')
-
 from agentbridge import (
     AgentBridge,
     get_workflow_components
@@ -39,6 +35,31 @@ def test_workflow_builder():
     print("✓ test_workflow_builder passed")
 
 
+def test_workflow_builder_add_tasks():
+    """Test adding tasks to the builder from a list of specs."""
+    task_specs = [
+        {"framework": "crewai", "operation": "analyze_data",
+         "inputs": {"dataset": "sales_data"}},
+        {"framework": "langgraph", "operation": "generate_report",
+         "inputs": {"analysis": "${task_0.result}"}, "dependencies": ["task_0"],
+         "timeout": 60},
+    ]
+    
+    workflow_def = (
+        WorkflowBuilder()
+        .add_tasks(task_specs)
+        .add_task("autogen", "review_report", dependencies=["task_1"])
+        .build("wf2", "Spec Workflow")
+    )
+    
+    assert [task.id for task in workflow_def.tasks] == ["task_0", "task_1", "task_2"]
+    assert workflow_def.tasks[1].dependencies == ["task_0"]
+    assert workflow_def.tasks[1].timeout == 60
+    assert workflow_def.tasks[2].framework == "autogen"
+    
+    print("✓ test_workflow_builder_add_tasks passed")
+
+
 def test_workflow_engine_initialization():
     """Test that workflow engine is properly initialized with bridge."""
     bridge = AgentBridge()
@@ -73,11 +94,162 @@ async def test_simple_workflow_registration():
     print("✓ test_simple_workflow_registration passed")
 
 
+def test_register_multiple_workflows():
+    """Test registering several workflows in one call."""
+    bridge = AgentBridge()
+    engine = bridge.get_workflow_engine()
+    
+    first = WorkflowBuilder().add_task("crewai", "plan").build("wf_a", "First")
+    second = (
+        WorkflowBuilder()
+        .add_task("crewai", "plan")
+        .add_task("autogen", "review", dependencies=["task_0"])
+        .build("wf_b", "Second")
+    )
+    engine.register_workflows([first, second])
+    
+    assert engine.workflow_definitions["wf_a"] is first
+    assert engine.workflow_definitions["wf_b"] is second
+    assert second.start_tasks == ["task_0"]
+    assert second.end_tasks == ["task_1"]
+    
+    print("✓ test_register_multiple_workflows passed")
+
+
+def test_resolved_inputs_are_not_shared():
+    """Test that each execution gets its own inputs dict, and re-registering picks up edits."""
+    from agentbridge.workflow import WorkflowExecution
+    
+    engine = AgentBridge().get_workflow_engine()
+    workflow_def = WorkflowBuilder().add_task("crewai", "plan", inputs={"goal": "ship"}).build("inputs_wf", "Inputs")
+    engine.register_workflow(workflow_def)
+    task_def = workflow_def.tasks[0]
+    
+    first = engine._resolve_inputs(task_def, WorkflowExecution(workflow_def=workflow_def, id="run_1"))
+    first["goal"] = "mutated by adapter"
+    second = engine._resolve_inputs(task_def, WorkflowExecution(workflow_def=workflow_def, id="run_2"))
+    assert second == {"goal": "ship"}
+    
+    task_def.inputs["goal"] = "review"
+    engine.register_workflow(workflow_def)
+    third = engine._resolve_inputs(task_def, WorkflowExecution(workflow_def=workflow_def, id="run_3"))
+    assert third == {"goal": "review"}
+    
+    print("✓ test_resolved_inputs_are_not_shared passed")
+
+
+async def test_ready_tasks_for_unregistered_definition():
+    """Test ready-task detection on a definition that was never registered."""
+    from agentbridge.workflow import WorkflowExecution
+    
+    engine = AgentBridge().get_workflow_engine()
+    workflow_def = WorkflowDefinition(
+        id="unregistered_wf",
+        name="Unregistered",
+        description="",
+        tasks=[
+            TaskDefinition(id="first", framework="crewai", operation="plan"),
+            TaskDefinition(id="second", framework="autogen", operation="review", dependencies=["first"]),
+        ],
+    )
+    workflow_execution = WorkflowExecution(workflow_def=workflow_def, id="run_1")
+    
+    ready = await engine._get_ready_tasks(workflow_execution)
+    assert [task_def.id for task_def in ready] == ["first"]
+    assert await engine._check_dependencies_met(workflow_def.tasks[1], workflow_execution) is False
+    
+    print("✓ test_ready_tasks_for_unregistered_definition passed")
+
+
+async def test_dependent_task_starts_when_its_dependency_finishes():
+    """Test that a task starts as soon as its own dependencies complete."""
+    import asyncio
+    
+    bridge = AgentBridge()
+    engine = bridge.get_workflow_engine()
+    release_slow = asyncio.Event()
+    finished = []
+    
+    async def fake_send_message(source, target, message):
+        task_id = message.content["task_id"]
+        if task_id == "task_1":
+            # Only released once task_2 has run, which needs task_0 alone
+            await release_slow.wait()
+        elif task_id == "task_2":
+            release_slow.set()
+        finished.append(task_id)
+        return {"status": "success"}
+    
+    bridge.send_message = fake_send_message
+    workflow_def = (
+        WorkflowBuilder()
+        .add_task("fast", "step")
+        .add_task("slow", "step")
+        .add_task("fast", "follow_up", dependencies=["task_0"])
+        .build("eager_wf", "Eager Workflow")
+    )
+    engine.register_workflow(workflow_def)
+    
+    await asyncio.wait_for(engine.execute_workflow("eager_wf"), timeout=5)
+    
+    assert finished == ["task_0", "task_2", "task_1"]
+    
+    print("✓ test_dependent_task_starts_when_its_dependency_finishes passed")
+
+
+async def test_task_failure_cancels_running_siblings():
+    """Test that a failing task cancels the other running tasks and records them."""
+    import asyncio
+    
+    bridge = AgentBridge()
+    engine = bridge.get_workflow_engine()
+    executions = []
+    
+    async def fake_send_message(source, target, message):
+        if not executions:
+            executions.extend(engine.active_executions.values())
+        if message.content["task_id"] == "task_0":
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+        await asyncio.Event().wait()  # Never finishes on its own
+    
+    bridge.send_message = fake_send_message
+    workflow_def = (
+        WorkflowBuilder()
+        .add_task("failing", "step")
+        .add_task("hanging", "step")
+        .add_task("never", "step", dependencies=["task_1"])
+        .build("failing_wf", "Failing Workflow")
+    )
+    engine.register_workflow(workflow_def)
+    
+    await asyncio.wait_for(engine.execute_workflow("failing_wf"), timeout=5)
+    
+    workflow_execution = executions[0]
+    assert workflow_execution.status == WorkflowStatus.FAILED
+    assert workflow_execution.error == "boom"
+    task_executions = workflow_execution.task_executions
+    assert task_executions["task_0"].status == TaskStatus.FAILED
+    assert task_executions["task_1"].status == TaskStatus.FAILED
+    assert task_executions["task_1"].error == "Task cancelled"
+    assert "task_2" not in task_executions
+    
+    print("✓ test_task_failure_cancels_running_siblings passed")
+
+
 if __name__ == "__main__":
+    import asyncio
+    
     print("Running workflow tests...")
     
     test_workflow_builder()
+    test_workflow_builder_add_tasks()
     test_workflow_engine_initialization()
     asyncio.run(test_simple_workflow_registration())
+    test_register_multiple_workflows()
+    test_resolved_inputs_are_not_shared()
+    asyncio.run(test_ready_tasks_for_unregistered_definition())
+    asyncio.run(test_dependent_task_starts_when_its_dependency_finishes())
+    asyncio.run(test_task_failure_cancels_running_siblings())
     
     print("\n✓ All workflow tests passed successfully!")
\ No newline at end of file
@@ -2,6 +2,8 @@
 Pre-built workflow templates for common use cases
 """
 
+import difflib
+
 from agentbridge import get_workflow_components
 
 
@@ -20,54 +22,56 @@ def create_data_analysis_workflow():
     
     workflow_def = (
         builder
-        .add_task(
-            framework="crewai_planner",
-            operation="plan_analysis",
-            inputs={
-                "dataset_description": "${dataset_desc}",
-                "analysis_goals": "${goals}",
-                "required_outputs": ["preprocessing_steps", "analysis_plan"]
-            },
-            outputs=["preprocessing_steps", "analysis_plan"],
-            timeout=600
-        )
-        .add_task(
-            framework="crewai_preprocessor",
-            operation="preprocess_data",
-            inputs={
-                "raw_data": "${raw_dataset}",
-                "preprocessing_steps": "${task_0.preprocessing_steps}",
-                "target_format": "structured"
+        .add_tasks([
+            {
+                "framework": "crewai_planner",
+                "operation": "plan_analysis",
+                "inputs": {
+                    "dataset_description": "${dataset_desc}",
+                    "analysis_goals": "${goals}",
+                    "required_outputs": ["preprocessing_steps", "analysis_plan"]
+                },
+                "outputs": ["preprocessing_steps", "analysis_plan"],
+                "timeout": 600
             },
-            outputs=["cleaned_data", "metadata"],
-            dependencies=["task_0"],  # Depends on planning task
-            timeout=1200
-        )
-        .add_task(
-            framework="langgraph_analyzer",
-            operation="perform_analysis",
-            inputs={
-                "data": "${task_1.cleaned_data}",
-                "analysis_plan": "${task_0.analysis_plan}",
-                "analysis_type": "statistical_correlation"
+            {
+                "framework": "crewai_preprocessor",
+                "operation": "preprocess_data",
+                "inputs": {
+                    "raw_data": "${raw_dataset}",
+                    "preprocessing_steps": "${task_0.preprocessing_steps}",
+                    "target_format": "structured"
+                },
+                "outputs": ["cleaned_data", "metadata"],
+                "dependencies": ["task_0"],  # Depends on planning task
+                "timeout": 1200
             },
-            outputs=["analysis_results", "statistical_measures", "anomalies"],
-            dependencies=["task_1"],  # Depends on preprocessing
-            timeout=1800
-        )
-        .add_task(
-            framework="autogen_collaborator",
-            operation="generate_insights",
-            inputs={
-                "analysis_results": "${task_2.analysis_results}",
-                "statistical_measures": "${task_2.statistical_measures}",
-                "stakeholder_requirements": "${requirements}",
-                "format_preference": "executive_summary"
+            {
+                "framework": "langgraph_analyzer",
+                "operation": "perform_analysis",
+                "inputs": {
+                    "data": "${task_1.cleaned_data}",
+                    "analysis_plan": "${task_0.analysis_plan}",
+                    "analysis_type": "statistical_correlation"
+                },
+                "outputs": ["analysis_results", "statistical_measures", "anomalies"],
+                "dependencies": ["task_1"],  # Depends on preprocessing
+                "timeout": 1800
             },
-            outputs=["insights_report", "recommendations", "visualizations"],
-            dependencies=["task_2"],  # Depends on analysis
-            timeout=1500
-        )
+            {
+                "framework": "autogen_collaborator",
+                "operation": "generate_insights",
+                "inputs": {
+                    "analysis_results": "${task_2.analysis_results}",
+                    "statistical_measures": "${task_2.statistical_measures}",
+                    "stakeholder_requirements": "${requirements}",
+                    "format_preference": "executive_summary"
+                },
+                "outputs": ["insights_report", "recommendations", "visualizations"],
+                "dependencies": ["task_2"],  # Depends on analysis
+                "timeout": 1500
+            }
+        ])
         .build(
             workflow_id="data_analysis_pipeline",
             name="Cross-Framework Data Analysis Pipeline",
@@ -89,54 +93,56 @@ def create_content_creation_workflow():
     
     workflow_def = (
         builder
-        .add_task(
-            framework="langgraph_strategist",
-            operation="define_content_strategy",
-            inputs={
-                "target_audience": "${audience}",
-                "content_goals": "${goals}",
-                "brand_guidelines": "${brand_guidelines}"
+        .add_tasks([
+            {
+                "framework": "langgraph_strategist",
+                "operation": "define_content_strategy",
+                "inputs": {
+                    "target_audience": "${audience}",
+                    "content_goals": "${goals}",
+                    "brand_guidelines": "${brand_guidelines}"
+                },
+                "outputs": ["strategy", "content_outline", "tone_guidelines"],
+                "timeout": 600
             },
-            outputs=["strategy", "content_outline", "tone_guidelines"],
-            timeout=600
-        )
-        .add_task(
-            framework="crewai_researcher",
-            operation="research_topic",
-            inputs={
-                "research_query": "${research_topic}",
-                "strategy": "${task_0.strategy}",
-                "sources_required": "${num_sources}"
+            {
+                "framework": "crewai_researcher",
+                "operation": "research_topic",
+                "inputs": {
+                    "research_query": "${research_topic}",
+                    "strategy": "${task_0.strategy}",
+                    "sources_required": "${num_sources}"
+                },
+                "outputs": ["research_findings", "source_materials", "key_points"],
+                "dependencies": ["task_0"],
+                "timeout": 1200
             },
-            outputs=["research_findings", "source_materials", "key_points"],
-            dependencies=["task_0"],
-            timeout=1200
-        )
-        .add_task(
-            framework="crewai_writer",
-            operation="draft_content",
-            inputs={
-                "outline": "${task_0.content_outline}",
-                "research": "${task_1.research_findings}",
-                "tone": "${task_0.tone_guidelines}",
-                "length_requirement": "${word_count}"
+            {
+                "framework": "crewai_writer",
+                "operation": "draft_content",
+                "inputs": {
+                    "outline": "${task_0.content_outline}",
+                    "research": "${task_1.research_findings}",
+                    "tone": "${task_0.tone_guidelines}",
+                    "length_requirement": "${word_count}"
+                },
+                "outputs": ["draft_content", "key_messages", "supporting_evidence"],
+                "dependencies": ["task_0", "task_1"],  # Depends on strategy and research
+                "timeout": 900
             },
-            outputs=["draft_content", "key_messages", "supporting_evidence"],
-            dependencies=["task_0", "task_1"],  # Depends on strategy and research
-            timeout=900
-        )
-        .add_task(
-            framework="autogen_editor",
-            operation="review_and_refine",
-            inputs={
-                "content": "${task_2.draft_content}",
-                "feedback_criteria": "${review_criteria}",
-                "collaboration_settings": "${collab_params}"
-            },
-            outputs=["final_content", "revision_notes", "quality_score"],
-            dependencies=["task_2"],  # Depends on draft
-            timeout=1200
-        )
+            {
+                "framework": "autogen_editor",
+                "operation": "review_and_refine",
+                "inputs": {
+                    "content": "${task_2.draft_content}",
+                    "feedback_criteria": "${review_criteria}",
+                    "collaboration_settings": "${collab_params}"
+                },
+                "outputs": ["final_content", "revision_notes", "quality_score"],
+                "dependencies": ["task_2"],  # Depends on draft
+                "timeout": 1200
+            }
+        ])
         .build(
             workflow_id="content_creation_pipeline",
             name="Cross-Framework Content Creation Pipeline",
@@ -158,42 +164,44 @@ def create_decision_support_workflow():
     
     workflow_def = (
         builder
-        .add_task(
-            framework="crewai_analyst",
-            operation="gather_information",
-            inputs={
-                "decision_context": "${context}",
-                "information_requirements": "${info_reqs}",
-                "stakeholders": "${stakeholder_list}"
+        .add_tasks([
+            {
+                "framework": "crewai_analyst",
+                "operation": "gather_information",
+                "inputs": {
+                    "decision_context": "${context}",
+                    "information_requirements": "${info_reqs}",
+                    "stakeholders": "${stakeholder_list}"
+                },
+                "outputs": ["information_pack", "facts", "constraints"],
+                "timeout": 900
             },
-            outputs=["information_pack", "facts", "constraints"],
-            timeout=900
-        )
-        .add_task(
-            framework="langgraph_decision_tree",
-            operation="evaluate_options",
-            inputs={
-                "information": "${task_0.information_pack}",
-                "decision_criteria": "${criteria}",
-                "options": "${option_list}"
+            {
+                "framework": "langgraph_decision_tree",
+                "operation": "evaluate_options",
+                "inputs": {
+                    "information": "${task_0.information_pack}",
+                    "decision_criteria": "${criteria}",
+                    "options": "${option_list}"
+                },
+                "outputs": ["evaluation_matrix", "risk_assessment", "preliminary_ranking"],
+                "dependencies": ["task_0"],
+                "timeout": 1200
             },
-            outputs=["evaluation_matrix", "risk_assessment", "preliminary_ranking"],
-            dependencies=["task_0"],
-            timeout=1200
-        )
-        .add_task(
-            framework="autogen_council",
-            operation="deliberate_and_advise",
-            inputs={
-                "evaluation": "${task_1.evaluation_matrix}",
-                "risk_assessment": "${task_1.risk_assessment}",
-                "stakeholder_perspectives": "${perspectives}",
-                "decision_timeline": "${timeline}"
-            },
-            outputs=["recommendation", "contingency_plans", "implementation_steps"],
-            dependencies=["task_1"],
-            timeout=1800
-        )
+            {
+                "framework": "autogen_council",
+                "operation": "deliberate_and_advise",
+                "inputs": {
+                    "evaluation": "${task_1.evaluation_matrix}",
+                    "risk_assessment": "${task_1.risk_assessment}",
+                    "stakeholder_perspectives": "${perspectives}",
+                    "decision_timeline": "${timeline}"
+                },
+                "outputs": ["recommendation", "contingency_plans", "implementation_steps"],
+                "dependencies": ["task_1"],
+                "timeout": 1800
+            }
+        ])
         .build(
             workflow_id="decision_support_pipeline",
             name="Cross-Framework Decision Support Pipeline",
@@ -220,9 +228,16 @@ def get_template(template_name):
         template_name (str): Name of the template ('data_analysis', 'content_creation', 'decision_support')
     
     Returns:
-        WorkflowDefinition: The requested workflow template
+        WorkflowDefinition: The requested workflow template. A new definition
+        is built on every call, so it can be customized and registered
+        without affecting other callers.
     """
-    if template_name not in WORKFLOW_TEMPLATES:
-        raise ValueError(f"Unknown template: {template_name}. Available: {list(WORKFLOW_TEMPLATES.keys())}")
+    factory = WORKFLOW_TEMPLATES.get(template_name)
+    if factory is None:
+        message = f"Unknown template: {template_name}. Available: {list(WORKFLOW_TEMPLATES.keys())}"
+        suggestions = difflib.get_close_matches(template_name, WORKFLOW_TEMPLATES.keys(), n=1)
+        if suggestions:
+            message += f". Did you mean '{suggestions[0]}'?"
+        raise ValueError(message)
     
-    return WORKFLOW_TEMPLATES[template_name]()
\ No newline at end of file
+    return factory()
\ No newline at end of file